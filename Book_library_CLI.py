@@ -1,7 +1,30 @@
+import csv
 import json
 import os
+import sys
+import threading
+import time
+import tracemalloc
+from array import array
 
 DATA_FILE = "books.json"
+JOURNAL_FILE = "books.journal"
+INDEX_FILE = "books.index.json"
+COMPACT_EVERY = 500
+IMPORT_BATCH = 5000
+BOOK_FIELDS = ["title", "author", "genre", "status"]
+COMPACT_BACKEND = os.environ.get("BOOKS_BACKEND") == "compact"
+
+_books = None
+_next_slot = 0
+_title_index = {}
+_genre_index = {}
+_status_index = {}
+_gram_index = None
+_seq = 0
+_journal_len = 0
+_lock = threading.Lock()
+_compactor = None
 
 
 QUOTES = [
@@ -18,15 +41,459 @@ QUOTES = [
 
 import random
 
-def load_books():
+_BIT_OFFSETS = [tuple(i for i in range(8) if byte >> i & 1) for byte in range(256)]
+
+class CompactBooks:
+    # Columnar book table for large catalogs. Genres are interned to integer codes and
+    # read/unread is one bit per slot; a deleted slot keeps None in the title column.
+    # Only the four BOOK_FIELDS are stored.
+
+    def __init__(self, books=()):
+        self._titles = []
+        self._authors = []
+        self._genre_codes = array("I")
+        self._genres = []
+        self._codes = {}
+        self._read = bytearray()
+        self._count = 0
+        for slot, book in enumerate(books):
+            self[slot] = book
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (slot for slot, title in enumerate(self._titles) if title is not None)
+
+    def __getitem__(self, slot):
+        title = self._titles[slot]
+        if title is None:
+            raise KeyError(slot)
+        return {
+            "title": title,
+            "author": self._authors[slot],
+            "genre": self._genres[self._genre_codes[slot]],
+            "status": "read" if self._read[slot >> 3] >> (slot & 7) & 1 else "unread"
+        }
+
+    def __setitem__(self, slot, book):
+        if slot == len(self._titles):
+            self._titles.append(None)
+            self._authors.append(None)
+            self._genre_codes.append(0)
+            if slot & 7 == 0:
+                self._read.append(0)
+        if self._titles[slot] is None:
+            self._count += 1
+        code = self._codes.get(book["genre"])
+        if code is None:
+            code = self._codes[book["genre"]] = len(self._genres)
+            self._genres.append(book["genre"])
+        self._titles[slot] = book["title"]
+        self._authors[slot] = book["author"]
+        self._genre_codes[slot] = code
+        if book["status"] == "read":
+            self._read[slot >> 3] |= 1 << (slot & 7)
+        else:
+            self._read[slot >> 3] &= ~(1 << (slot & 7)) & 0xFF
+
+    def pop(self, slot):
+        book = self[slot]
+        self._titles[slot] = self._authors[slot] = None
+        self._count -= 1
+        return book
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        return (self[slot] for slot in self)
+
+    def items(self):
+        return ((slot, self[slot]) for slot in self)
+
+    def _rows(self, slots):
+        titles, authors, codes, genres, read = self._titles, self._authors, self._genre_codes, self._genres, self._read
+        return [{
+            "title": titles[slot],
+            "author": authors[slot],
+            "genre": genres[codes[slot]],
+            "status": "read" if read[slot >> 3] >> (slot & 7) & 1 else "unread"
+        } for slot in slots if titles[slot] is not None]
+
+    def find_by_genre(self, genre):
+        genre = genre.lower()
+        codes = {code for name, code in self._codes.items() if name.lower() == genre}
+        return self._rows(slot for slot, code in enumerate(self._genre_codes) if code in codes)
+
+    def find_by_status(self, status):
+        flip = 0 if status == "read" else 0xFF
+        size = len(self._titles)
+        return self._rows(slot for base, byte in enumerate(self._read)
+                          for slot in (base * 8 + i for i in _BIT_OFFSETS[byte ^ flip]) if slot < size)
+
+def _new_table(books):
+    return CompactBooks(books) if COMPACT_BACKEND else dict(enumerate(books))
+
+def _read_snapshot():
     if not os.path.exists(DATA_FILE):
-        return []
+        return 0, []
     with open(DATA_FILE, "r") as f:
-        return json.load(f)
+        data = json.load(f)
+    # A plain list is a books.json written before the journal existed.
+    if isinstance(data, list):
+        return 0, data
+    return data["seq"], data["books"]
+
+def _read_journal(after_seq):
+    records = []
+    if not os.path.exists(JOURNAL_FILE):
+        return records
+    with open(JOURNAL_FILE, "rb") as f:
+        good = 0
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b"\n"):
+                break
+            good += len(line)
+            if record["seq"] > after_seq:
+                records.append(record)
+    # Drop a torn append left by a crash so the next append starts on a clean line.
+    if good != os.path.getsize(JOURNAL_FILE):
+        with open(JOURNAL_FILE, "r+b") as f:
+            f.truncate(good)
+    return records
+
+def _snapshot_stamp():
+    st = os.stat(DATA_FILE)
+    return [st.st_size, st.st_mtime_ns]
+
+def _index_fields(slot, book):
+    # The compact backend filters its genre and status columns directly.
+    if COMPACT_BACKEND:
+        return
+    _genre_index.setdefault(book["genre"].lower(), set()).add(slot)
+    _status_index.setdefault(book["status"], set()).add(slot)
+
+def _unindex_fields(slot, book):
+    if COMPACT_BACKEND:
+        return
+    for index, key in ((_genre_index, book["genre"].lower()), (_status_index, book["status"])):
+        slots = index[key]
+        slots.discard(slot)
+        if not slots:
+            del index[key]
+
+def _grams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _book_grams(book):
+    return _grams(book["title"].lower()) | _grams(book["author"].lower())
+
+def _index_grams(index, slot, book):
+    for gram in _book_grams(book):
+        index.setdefault(gram, set()).add(slot)
+
+def _unindex_grams(index, slot, book):
+    for gram in _book_grams(book):
+        slots = index[gram]
+        slots.discard(slot)
+        if not slots:
+            del index[gram]
+
+def _build_gram_index(books):
+    index = {}
+    for slot, book in books.items():
+        _index_grams(index, slot, book)
+    return index
+
+def _match_rank(book, keyword):
+    # Lower is better: exact, prefix, word start, then anywhere; any title match beats an author match.
+    for base, field in ((0, "title"), (4, "author")):
+        text = book[field].lower()
+        pos = text.find(keyword)
+        if pos == -1:
+            continue
+        if text == keyword:
+            return base
+        if pos == 0:
+            return base + 1
+        if not text[pos - 1].isalnum():
+            return base + 2
+        return base + 3
+    return None
+
+def _search(books, gram_index, keyword):
+    keyword = keyword.lower()
+    if len(keyword) < 3:
+        candidates = books.keys()
+    else:
+        postings = sorted((gram_index.get(gram, set()) for gram in _grams(keyword)), key=len)
+        candidates = postings[0].intersection(*postings[1:])
+    matches = []
+    for slot in candidates:
+        rank = _match_rank(books[slot], keyword)
+        if rank is not None:
+            matches.append((rank, slot))
+    matches.sort()
+    return [books[slot] for _, slot in matches]
+
+def _rebuild_index():
+    global _title_index, _genre_index, _status_index, _gram_index
+    _title_index, _genre_index, _status_index = {}, {}, {}
+    _gram_index = None
+    for slot, book in _books.items():
+        _title_index.setdefault(book["title"].lower(), []).append(slot)
+        _index_fields(slot, book)
+
+def _load_index(seq):
+    global _title_index, _genre_index, _status_index
+    if not os.path.exists(INDEX_FILE) or not os.path.exists(DATA_FILE):
+        return False
+    try:
+        with open(INDEX_FILE, "r") as f:
+            data = json.load(f)
+    except ValueError:
+        return False
+    if (data.get("seq") != seq or data.get("snapshot") != _snapshot_stamp()
+            or data.get("compact", False) != COMPACT_BACKEND):
+        return False
+    _title_index = data["title"]
+    _genre_index = {key: set(slots) for key, slots in data["genre"].items()}
+    _status_index = {key: set(slots) for key, slots in data["status"].items()}
+    return True
+
+def _apply(record):
+    global _next_slot
+    op = record["op"]
+    if op == "add":
+        book = record["book"]
+        _books[_next_slot] = book
+        _title_index.setdefault(book["title"].lower(), []).append(_next_slot)
+        _index_fields(_next_slot, book)
+        if _gram_index is not None:
+            _index_grams(_gram_index, _next_slot, book)
+        _next_slot += 1
+    elif op == "update":
+        slots = _title_index.get(record["title"].lower())
+        if slots:
+            book = _books[slots[0]]
+            regram = _gram_index is not None and "author" in record["fields"]
+            _unindex_fields(slots[0], book)
+            if regram:
+                _unindex_grams(_gram_index, slots[0], book)
+            book.update(record["fields"])
+            _books[slots[0]] = book
+            _index_fields(slots[0], book)
+            if regram:
+                _index_grams(_gram_index, slots[0], book)
+    elif op == "delete":
+        for slot in _title_index.pop(record["title"].lower(), []):
+            book = _books.pop(slot)
+            _unindex_fields(slot, book)
+            if _gram_index is not None:
+                _unindex_grams(_gram_index, slot, book)
+
+def _write_json_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _write_snapshot(seq):
+    _write_json_atomic(DATA_FILE, {"seq": seq, "books": list(_books.values())})
+    # Index slots are rewritten as positions in the snapshot list that was just written.
+    position = {slot: i for i, slot in enumerate(_books)}
+    _write_json_atomic(INDEX_FILE, {
+        "seq": seq,
+        "snapshot": _snapshot_stamp(),
+        "compact": COMPACT_BACKEND,
+        "title": {key: [position[s] for s in slots] for key, slots in _title_index.items()},
+        "genre": {key: sorted(position[s] for s in slots) for key, slots in _genre_index.items()},
+        "status": {key: sorted(position[s] for s in slots) for key, slots in _status_index.items()},
+    })
+    # Records up to seq are now in the snapshot; a crash before this truncate is harmless
+    # because replay skips them by sequence number.
+    open(JOURNAL_FILE, "w").close()
+
+def _load():
+    global _books, _next_slot, _seq, _journal_len
+    if _books is not None:
+        return
+    seq, books = _read_snapshot()
+    _books = _new_table(books)
+    _next_slot = len(books)
+    if not _load_index(seq):
+        _rebuild_index()
+    records = _read_journal(seq)
+    for record in records:
+        _apply(record)
+    _seq = records[-1]["seq"] if records else seq
+    _journal_len = len(records)
+
+def load_books():
+    _load()
+    return list(_books.values())
 
 def save_books(books):
-    with open(DATA_FILE, "w") as f:
-        json.dump(books, f, indent=4)
+    global _books, _next_slot, _journal_len
+    with _lock:
+        _load()
+        _books = _new_table(books)
+        _next_slot = len(books)
+        _rebuild_index()
+        _write_snapshot(_seq)
+        _journal_len = 0
+
+def find_books_by_title(title):
+    _load()
+    return [_books[slot] for slot in _title_index.get(title.lower(), [])]
+
+def find_books_by_genre(genre):
+    _load()
+    if COMPACT_BACKEND:
+        return _books.find_by_genre(genre)
+    return [_books[slot] for slot in sorted(_genre_index.get(genre.lower(), ()))]
+
+def find_books_by_status(status):
+    _load()
+    if COMPACT_BACKEND:
+        return _books.find_by_status(status)
+    return [_books[slot] for slot in sorted(_status_index.get(status, ()))]
+
+def find_books_by_keyword(keyword):
+    global _gram_index
+    _load()
+    with _lock:
+        if _gram_index is None:
+            _gram_index = _build_gram_index(_books)
+    return _search(_books, _gram_index, keyword)
+
+def _commit_batch(records, compact=True):
+    global _seq, _journal_len
+    with _lock:
+        _load()
+        for i, record in enumerate(records, 1):
+            record["seq"] = _seq + i
+        with open(JOURNAL_FILE, "a") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        _seq += len(records)
+        for record in records:
+            _apply(record)
+        _journal_len += len(records)
+    if compact and _journal_len >= COMPACT_EVERY:
+        compact_in_background()
+
+def _commit(record):
+    _commit_batch([record])
+
+def compact_books():
+    global _journal_len
+    with _lock:
+        _load()
+        _write_snapshot(_seq)
+        _journal_len = 0
+
+def compact_in_background():
+    global _compactor
+    if _compactor is not None and _compactor.is_alive():
+        return
+    _compactor = threading.Thread(target=compact_books)
+    _compactor.start()
+
+def _read_rows(path):
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield None
+
+def _validate_row(row):
+    # Same rules as add_book; "read"/"unread" are accepted too so exports re-import cleanly.
+    if not isinstance(row, dict):
+        return None, "not a valid record"
+    if any(not isinstance(row.get(key), (str, type(None))) for key in ("title", "author", "genre", "status")):
+        return None, "not a valid record"
+    title = (row.get("title") or "").strip()
+    if not title:
+        return None, "title cannot be empty"
+    status = (row.get("status") or "").strip().lower()
+    if status in ["yes", "read"]:
+        status = "read"
+    elif status in ["no", "unread"]:
+        status = "unread"
+    else:
+        return None, "status must be 'yes' or 'no'"
+    return {
+        "title": title,
+        "author": (row.get("author") or "").strip(),
+        "genre": (row.get("genre") or "").strip(),
+        "status": status
+    }, None
+
+def import_books(path, batch_size=IMPORT_BATCH):
+    _load()
+    added = duplicates = 0
+    rejected = []
+    batch, batch_titles = [], set()
+    for row_no, row in enumerate(_read_rows(path), 1):
+        book, error = _validate_row(row)
+        if error:
+            rejected.append((row_no, error))
+            continue
+        key = book["title"].lower()
+        if key in batch_titles or key in _title_index:
+            duplicates += 1
+            continue
+        batch.append({"op": "add", "book": book})
+        batch_titles.add(key)
+        if len(batch) >= batch_size:
+            _commit_batch(batch, compact=False)
+            added += len(batch)
+            batch, batch_titles = [], set()
+    if batch:
+        _commit_batch(batch, compact=False)
+        added += len(batch)
+    if added:
+        compact_books()
+    return added, duplicates, rejected
+
+def export_books(path):
+    _load()
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            writer = csv.DictWriter(f, fieldnames=BOOK_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for book in _books.values():
+                writer.writerow(book)
+                count += 1
+        elif path.lower().endswith(".jsonl"):
+            for book in _books.values():
+                f.write(json.dumps(book) + "\n")
+                count += 1
+        else:
+            f.write("[")
+            for book in _books.values():
+                f.write(",\n" if count else "\n")
+                f.write(json.dumps(book))
+                count += 1
+            f.write("\n]\n")
+    return count
 
 def add_book():
     title = input("Enter book title: ").strip()
@@ -40,51 +507,45 @@ def add_book():
         print("Status must be 'yes' or 'no'.")
         return
 
-    books = load_books()
-    books.append({
+    _commit({"op": "add", "book": {
         "title": title,
         "author": author,
         "genre": genre,
         "status": "read" if status == 'yes' else "unread"
-    })
-    save_books(books)
+    }})
     print("Book added successfully!")
     print(random.choice(QUOTES))
 
 def update_book():
-    books = load_books()
     title = input("Enter the title of the book to update: ").strip()
-    for book in books:
-        if book["title"].lower() == title.lower():
-            print("Leave a field blank to keep it unchanged.")
-            new_author = input(f"Enter new author name [{book['author']}]: ").strip()
-            new_genre = input(f"Enter new genre [{book['genre']}]: ").strip()
-            new_status = input(f"Enter new status (read/unread) [{book['status']}]: ").strip().lower()
-            if new_author:
-                book["author"] = new_author
-            if new_genre:
-                book["genre"] = new_genre
-            if new_status in ['read', 'unread']:
-                book["status"] = new_status
-            save_books(books)
-            print("Book updated successfully!")
-            return
+    for book in find_books_by_title(title):
+        print("Leave a field blank to keep it unchanged.")
+        new_author = input(f"Enter new author name [{book['author']}]: ").strip()
+        new_genre = input(f"Enter new genre [{book['genre']}]: ").strip()
+        new_status = input(f"Enter new status (read/unread) [{book['status']}]: ").strip().lower()
+        fields = {}
+        if new_author:
+            fields["author"] = new_author
+        if new_genre:
+            fields["genre"] = new_genre
+        if new_status in ['read', 'unread']:
+            fields["status"] = new_status
+        _commit({"op": "update", "title": book["title"], "fields": fields})
+        print("Book updated successfully!")
+        return
     print("Book not found.")
 
 def delete_book():
-    books = load_books()
     title = input("Enter the title of the book to delete: ").strip()
-    new_books = [book for book in books if book["title"].lower() != title.lower()]
-    if len(new_books) == len(books):
+    if not find_books_by_title(title):
         print("Book not found.")
     else:
-        save_books(new_books)
+        _commit({"op": "delete", "title": title})
         print("Book deleted successfully.")
 
 def list_books_by_genre():
     genre = input("Enter genre to list: ").strip().lower()
-    books = load_books()
-    filtered = [book for book in books if book["genre"].lower() == genre]
+    filtered = find_books_by_genre(genre)
     if filtered:
         for book in filtered:
             print(f"{book['title']} by {book['author']} - {book['status'].capitalize()}")
@@ -96,8 +557,7 @@ def list_books_by_status():
     if status not in ['read', 'unread']:
         print("Invalid status entered.")
         return
-    books = load_books()
-    filtered = [book for book in books if book["status"] == status]
+    filtered = find_books_by_status(status)
     if filtered:
         for book in filtered:
             print(f"{book['title']} by {book['author']} - Genre: {book['genre']}")
@@ -106,25 +566,41 @@ def list_books_by_status():
 
 def mark_book_as_read():
     title = input("Enter the title of the book to mark as read: ").strip()
-    books = load_books()
-    for book in books:
-        if book["title"].lower() == title.lower():
-            book["status"] = "read"
-            save_books(books)
-            print("Book marked as read.")
-            return
+    for book in find_books_by_title(title):
+        _commit({"op": "update", "title": book["title"], "fields": {"status": "read"}})
+        print("Book marked as read.")
+        return
     print("Book not found.")
 
 def search_books():
     keyword = input("Enter book title or author name to search: ").strip().lower()
-    books = load_books()
-    filtered = [book for book in books if keyword in book["title"].lower() or keyword in book["author"].lower()]
+    filtered = find_books_by_keyword(keyword)
     if filtered:
         for book in filtered:
             print(f"{book['title']} by {book['author']} - {book['status'].capitalize()} - Genre: {book['genre']}")
     else:
         print("No matching books found.")
 
+def bulk_import(path=None):
+    path = path or input("Enter path of CSV or JSONL file to import: ").strip()
+    if not os.path.exists(path):
+        print("File not found.")
+        return
+    added, duplicates, rejected = import_books(path)
+    print(f"Imported {added} books, skipped {duplicates} duplicates, rejected {len(rejected)} rows.")
+    for row_no, error in rejected[:10]:
+        print(f"  Row {row_no}: {error}")
+    if len(rejected) > 10:
+        print(f"  ... and {len(rejected) - 10} more.")
+
+def bulk_export(path=None):
+    path = path or input("Enter export file path (.csv, .jsonl or .json): ").strip()
+    if not path:
+        print("Path cannot be empty.")
+        return
+    count = export_books(path)
+    print(f"Exported {count} books to {path}.")
+
 def show_menu():
     print("\n BOOK LIBRARY CLI ")
     print("1. Add a new book")
@@ -134,13 +610,16 @@ def show_menu():
     print("5. List books by read/unread status")
     print("6. Mark a book as read")
     print("7. Search by title or author")
-    print("8. Exit")
+    print("8. Compact library storage")
+    print("9. Bulk import from CSV/JSONL")
+    print("10. Export catalog")
+    print("11. Exit")
 
 def main():
     print("Welcome to your personal Book Library!")
     while True:
         show_menu()
-        choice = input("Enter your choice (1-8): ").strip()
+        choice = input("Enter your choice (1-11): ").strip()
         if choice == "1":
             add_book()
         elif choice == "2":
@@ -156,10 +635,78 @@ def main():
         elif choice == "7":
             search_books()
         elif choice == "8":
+            compact_books()
+            print("Library storage compacted.")
+        elif choice == "9":
+            bulk_import()
+        elif choice == "10":
+            bulk_export()
+        elif choice == "11":
             print("Goodbye! Keep reading 📖.")
             break
         else:
-            print("Invalid choice. Please enter a number between 1 and 8.")
+            print("Invalid choice. Please enter a number between 1 and 11.")
+
+def _synthetic_books(size):
+    rng = random.Random(42)
+    words = ["the", "war", "and", "peace", "night", "of", "king", "river", "shadow", "garden",
+             "silent", "empire", "storm", "house", "glass", "winter", "road", "stone", "light", "dark"]
+    surnames = ["smith", "tolstoy", "austen", "king", "martin", "nguyen", "okafor", "rossi", "haddad", "kim"]
+    return [{
+        "title": " ".join(rng.choice(words) for _ in range(rng.randint(2, 5))).title(),
+        "author": f"{rng.choice(words).title()} {rng.choice(surnames).title()}",
+        "genre": rng.choice(["Fiction", "History", "Poetry", "Science", "Travel", "Drama"]),
+        "status": rng.choice(["read", "unread"]),
+    } for _ in range(size)]
+
+def benchmark_search(size=200000, queries=("the", "war", "king", "smith", "night of", "zzz")):
+    books = dict(enumerate(_synthetic_books(size)))
+    start = time.perf_counter()
+    index = _build_gram_index(books)
+    print(f"Built trigram index over {size} books in {time.perf_counter() - start:.2f}s")
+    _search(books, index, queries[0])  # warm-up, so the first timing doesn't absorb post-build GC
+    for keyword in queries:
+        start = time.perf_counter()
+        scanned = [book for book in books.values() if keyword in book["title"].lower() or keyword in book["author"].lower()]
+        scan_time = time.perf_counter() - start
+        start = time.perf_counter()
+        found = _search(books, index, keyword)
+        index_time = time.perf_counter() - start
+        assert len(found) == len(scanned)
+        print(f"{keyword!r:>12}: {len(found):>7} hits  scan {scan_time * 1000:8.1f} ms  index {index_time * 1000:8.1f} ms")
+
+def benchmark_memory(size=200000):
+    # Round-trip through JSON so the dict side has the same unshared strings load_books produces.
+    raw = json.dumps(_synthetic_books(size))
+    tracemalloc.start()
+    books = json.loads(raw)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    table = CompactBooks(json.loads(raw))
+    compact_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{size} books: dicts {dict_bytes / 2**20:.1f} MiB, compact {compact_bytes / 2**20:.1f} MiB")
+    for label, by_genre, by_status in (
+        ("dicts", lambda: [b for b in books if b["genre"].lower() == "poetry"], lambda: [b for b in books if b["status"] == "read"]),
+        ("compact", lambda: table.find_by_genre("poetry"), lambda: table.find_by_status("read")),
+    ):
+        start = time.perf_counter()
+        genre_hits = len(by_genre())
+        genre_time = time.perf_counter() - start
+        start = time.perf_counter()
+        status_hits = len(by_status())
+        status_time = time.perf_counter() - start
+        print(f"{label:>8}: genre {genre_hits} hits in {genre_time * 1000:.1f} ms, status {status_hits} hits in {status_time * 1000:.1f} ms")
 
 if __name__ == "__main__":
-    main()
+    args = sys.argv[1:]
+    if args == ["bench"]:
+        benchmark_search()
+        benchmark_memory()
+    elif len(args) == 2 and args[0] == "import":
+        bulk_import(args[1])
+    elif len(args) == 2 and args[0] == "export":
+        bulk_export(args[1])
+    else:
+        main()
@@ -1,45 +1,257 @@
+import ast
 import math
 import json
 import os
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
 HISTORY_FILE = "calc_history.json"
-history = []
+HISTORY_LOG = "calc_history.jsonl"
+HISTORY_SIZE = int(os.environ.get("CALC_HISTORY_SIZE", "1000"))
+CACHE_SIZE = 256
+RESULT_CACHE_SIZE = 1024
+BATCH_CHUNK = 10000
+history = deque(maxlen=HISTORY_SIZE)
+_next_id = 1
+_log_len = 0
+
+FUNCTIONS = {
+    'sqrt': math.sqrt,
+    'log': math.log10,
+    'sin': lambda x: math.sin(math.radians(x)),
+    'cos': lambda x: math.cos(math.radians(x)),
+    'tan': lambda x: math.tan(math.radians(x)),
+}
+MAX_POWER_BITS = 10000
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Constant, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub,
+)
+_compiled = OrderedDict()
+_results = OrderedDict()
+cache_stats = {"hits": 0, "misses": 0, "result_hits": 0, "result_misses": 0}
+
+
+def _safe_pow(base, exponent):
+    # Exact integer powers grow without bound (9**9**9**9); refuse any result wider than MAX_POWER_BITS.
+    if isinstance(base, (int, float)) and isinstance(exponent, (int, float)) and abs(base) > 1 and exponent > 0:
+        if exponent * math.log2(abs(base)) > MAX_POWER_BITS:
+            raise OverflowError("result too large")
+    return base ** exponent
+
+_NAMESPACE = {"__builtins__": {}, "_pow": _safe_pow, **FUNCTIONS}
+
+
+class _GuardPowers(ast.NodeTransformer):
+    # Runs after _validate, so "_pow" can only come from here, never from user input.
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Pow):
+            call = ast.Call(func=ast.Name(id="_pow", ctx=ast.Load()), args=[node.left, node.right], keywords=[])
+            return ast.copy_location(call, node)
+        return node
 
 
 def save_history():
-    with open(HISTORY_FILE, "w") as f:
-        json.dump(history, f, indent=4)
+    # Compaction: write the ring buffer as the new snapshot, then start an empty log.
+    global _log_len
+    tmp = HISTORY_FILE + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(list(history), f, indent=4)
+    os.replace(tmp, HISTORY_FILE)
+    open(HISTORY_LOG, "w").close()
+    _log_len = 0
+
+def _append_log(record):
+    global _log_len
+    with open(HISTORY_LOG, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    _log_len += 1
+    if _log_len >= 2 * HISTORY_SIZE:
+        save_history()
 
 def load_history():
-    global history
+    global history, _next_id, _log_len
+    entries = deque(maxlen=HISTORY_SIZE)
     if os.path.exists(HISTORY_FILE):
         with open(HISTORY_FILE) as f:
-            history = json.load(f)
+            for i, entry in enumerate(json.load(f), 1):
+                entry.setdefault("id", i)
+                entries.append(entry)
+    last_id = entries[-1]["id"] if entries else 0
+    _log_len = 0
+    if os.path.exists(HISTORY_LOG):
+        with open(HISTORY_LOG, "rb") as f:
+            good = 0
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                good += len(line)
+                _log_len += 1
+                if "delete" in record:
+                    for i, entry in enumerate(entries):
+                        if entry["id"] == record["delete"]:
+                            del entries[i]
+                            break
+                # Entries at or below last_id are already in the snapshot (crash during compaction).
+                elif record["id"] > last_id:
+                    entries.append(record)
+                    last_id = record["id"]
+        # Drop a torn append left by a crash so the next append starts on a clean line.
+        if good != os.path.getsize(HISTORY_LOG):
+            with open(HISTORY_LOG, "r+b") as f:
+                f.truncate(good)
+    history = entries
+    _next_id = last_id + 1
+    for entry in history:
+        _remember(normalize_expression(entry["expression"]), (entry["result"], None))
+
+def normalize_expression(expr):
+    return " ".join(expr.split()).replace('^', '**')
+
+def _remember(key, outcome):
+    _results[key] = outcome
+    _results.move_to_end(key)
+    if len(_results) > RESULT_CACHE_SIZE:
+        _results.popitem(last=False)
+
+def _validate(tree, variables=()):
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise SyntaxError(f"{type(node).__name__} is not allowed")
+        if isinstance(node, ast.Name) and node.id not in FUNCTIONS and node.id not in variables:
+            raise SyntaxError(f"unknown name {node.id!r}")
+        if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.keywords):
+            raise SyntaxError("only plain calls to math functions are allowed")
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+            raise SyntaxError("only numbers are allowed")
+
+def free_variables(expr):
+    tree = ast.parse(normalize_expression(expr), mode="eval")
+    return sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and node.id not in FUNCTIONS})
+
+def compile_expression(expr, variables=()):
+    key = (normalize_expression(expr), tuple(variables))
+    code = _compiled.get(key)
+    if code is not None:
+        _compiled.move_to_end(key)
+        cache_stats["hits"] += 1
+        return code
+    cache_stats["misses"] += 1
+    tree = ast.parse(key[0], mode="eval")
+    _validate(tree, variables)
+    tree = ast.fix_missing_locations(_GuardPowers().visit(tree))
+    code = compile(tree, "<expression>", "eval")
+    _compiled[key] = code
+    if len(_compiled) > CACHE_SIZE:
+        _compiled.popitem(last=False)
+    return code
+
+def cache_info():
+    return {**cache_stats, "size": len(_compiled), "capacity": CACHE_SIZE,
+            "results": len(_results), "result_capacity": RESULT_CACHE_SIZE}
+
+def _error_message(exc):
+    if isinstance(exc, ZeroDivisionError):
+        return "Error: Division by zero."
+    if isinstance(exc, OverflowError):
+        return "Error: Result too large."
+    if isinstance(exc, ValueError):
+        return "Error: Invalid math domain."
+    return "Error: Invalid expression."
+
+def _finish(value):
+    if isinstance(value, int) and value.bit_length() > MAX_POWER_BITS:
+        raise OverflowError("result too large")
+    return round(value, 5)
 
 def evaluate_expression(expr):
+    # Keyed on the whitespace-collapsed text, which never joins tokens, so "2 * * 3" and "2**3" stay apart.
+    key = normalize_expression(expr)
+    outcome = _results.get(key)
+    if outcome is not None:
+        _results.move_to_end(key)
+        cache_stats["result_hits"] += 1
+    else:
+        cache_stats["result_misses"] += 1
+        try:
+            code = compile_expression(expr)
+        except Exception:
+            # Input that does not parse or validate is never cached.
+            print(" Error: Invalid expression.")
+            return None
+        try:
+            outcome = (_finish(eval(code, _NAMESPACE)), None)
+        except Exception as e:
+            outcome = (None, _error_message(e))
+        _remember(key, outcome)
+    result, error = outcome
+    if error:
+        print(f" {error}")
+    return result
+
+def _numpy_namespace(np):
+    # Same degree-based trig and base-10 log as FUNCTIONS, applied element-wise.
+    return {
+        "__builtins__": {},
+        "_pow": _safe_pow,
+        'sqrt': np.sqrt,
+        'log': np.log10,
+        'sin': lambda x: np.sin(np.radians(x)),
+        'cos': lambda x: np.cos(np.radians(x)),
+        'tan': lambda x: np.tan(np.radians(x)),
+    }
+
+def _load_columns(np, path):
+    # Column names are lowercased to match the expression, which the CLI lowercases.
+    if path.lower().endswith(".npz"):
+        with np.load(path) as data:
+            return {name.lower(): np.asarray(data[name], dtype=float) for name in data.files}
+    if path.lower().endswith(".npy"):
+        data = np.load(path)
+        if data.dtype.names is None:
+            raise ValueError("a .npy input must be a structured array with named fields")
+        return {name.lower(): np.asarray(data[name], dtype=float) for name in data.dtype.names}
+    data = np.genfromtxt(path, delimiter=",", names=True, dtype=float, case_sensitive="lower")
+    return {name: np.atleast_1d(data[name]) for name in data.dtype.names}
+
+def evaluate_batch(expr, columns):
+    import numpy as np
+    variables = free_variables(expr)
+    missing = [name for name in variables if name not in columns]
+    if missing:
+        raise KeyError(f"missing input columns: {', '.join(missing)}")
+    namespace = _numpy_namespace(np)
+    namespace.update((name, columns[name]) for name in variables)
+    size = len(next(iter(columns.values())))
+    # Division by zero and domain errors become inf/nan per row instead of aborting the batch.
+    with np.errstate(all="ignore"):
+        result = eval(compile_expression(expr, variables), namespace)
+    return np.round(np.broadcast_to(np.asarray(result, dtype=float), (size,)), 5)
+
+def _evaluate_line(expr):
     try:
-      
-        allowed = {
-            'sqrt': math.sqrt,
-            'log': math.log10,
-            'sin': lambda x: math.sin(math.radians(x)),
-            'cos': lambda x: math.cos(math.radians(x)),
-            'tan': lambda x: math.tan(math.radians(x)),
-            '^': '**'
-        }
-        for key in allowed:
-            if key in expr:
-                expr = expr.replace(key, f'{key}')
-        expr = expr.replace('^', '**')
-        result = eval(expr, {"__builtins__": None}, allowed)
-        return round(result, 5)
-    except ZeroDivisionError:
-        print(" Error: Division by zero.")
-    except ValueError:
-        print(" Error: Invalid math domain.")
-    except Exception:
-        print(" Error: Invalid expression.")
-    return None
+        return expr, _finish(eval(compile_expression(expr), _NAMESPACE))
+    except Exception as e:
+        return expr, _error_message(e)
+
+def evaluate_file(path, output, workers=None):
+    count = 0
+    with open(path) as src, open(output, "w") as out, ProcessPoolExecutor(workers) as pool:
+        lines = (line.strip().lower() for line in src if line.strip())
+        while True:
+            chunk = list(islice(lines, BATCH_CHUNK))
+            if not chunk:
+                break
+            for expr, result in pool.map(_evaluate_line, chunk, chunksize=256):
+                out.write(f"{expr}\t{result}\n")
+                count += 1
+    return count
 
 
 def calculate():
@@ -47,7 +259,14 @@ def calculate():
     result = evaluate_expression(expr)
     if result is not None:
         print(f" Result: {result}")
-        history.append({"expression": expr, "result": result})
+        add_history_entry(expr, result)
+
+def add_history_entry(expr, result):
+    global _next_id
+    entry = {"id": _next_id, "expression": expr, "result": result}
+    _next_id += 1
+    history.append(entry)
+    _append_log(entry)
 
 def show_history():
     if not history:
@@ -61,13 +280,50 @@ def delete_entry():
     try:
         index = int(input("Enter entry number to delete: ").strip())
         if 1 <= index <= len(history):
-            deleted = history.pop(index - 1)
+            deleted = history[index - 1]
+            del history[index - 1]
+            _append_log({"delete": deleted["id"]})
             print(f" Deleted: {deleted['expression']} = {deleted['result']}")
         else:
             print(" Invalid entry number.")
     except ValueError:
         print(" Invalid input.")
 
+def batch_calculate():
+    try:
+        import numpy as np
+    except ImportError:
+        print(" Batch mode needs NumPy (pip install numpy).")
+        return
+    expr = input(" Enter expression with variables (e.g. sqrt(x)^2 + sin(y)): ").strip().lower()
+    path = input(" Input data file (.csv with header, .npy or .npz): ").strip()
+    output = input(" Output CSV file [batch_results.csv]: ").strip() or "batch_results.csv"
+    if not os.path.exists(path):
+        print(" Input file not found.")
+        return
+    try:
+        columns = _load_columns(np, path)
+        result = evaluate_batch(expr, columns)
+    except KeyError as e:
+        print(f" Error: {e.args[0]}")
+        return
+    except Exception as e:
+        print(f" {_error_message(e)}")
+        return
+    names = free_variables(expr)
+    table = np.column_stack([columns[name] for name in names] + [result])
+    np.savetxt(output, table, fmt="%.10g", delimiter=",", header=",".join(names + ["result"]), comments="")
+    print(f" Evaluated {len(result)} rows into {output}.")
+
+def calculate_file():
+    path = input(" File of expressions (one per line): ").strip()
+    output = input(" Output file [expression_results.tsv]: ").strip() or "expression_results.tsv"
+    if not os.path.exists(path):
+        print(" Input file not found.")
+        return
+    count = evaluate_file(path, output)
+    print(f" Evaluated {count} expressions into {output}.")
+
 def save_to_file():
     save_history()
     print(" History saved to file.")
@@ -84,13 +340,15 @@ def menu():
     print("3. Delete History Entry")
     print("4. Save History to File")
     print("5. Load History from File")
-    print("6. Exit")
+    print("6. Batch Evaluate over Data File")
+    print("7. Evaluate Expression File")
+    print("8. Exit")
 
 def main():
     load_from_file()
     while True:
         menu()
-        choice = input("Choose (1–6): ").strip()
+        choice = input("Choose (1–8): ").strip()
         if choice == "1":
             calculate()
         elif choice == "2":
@@ -102,6 +360,10 @@ def main():
         elif choice == "5":
             load_from_file()
         elif choice == "6":
+            batch_calculate()
+        elif choice == "7":
+            calculate_file()
+        elif choice == "8":
             print(" Goodbye, Mathematician!")
             break
         else:
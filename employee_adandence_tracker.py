@@ -1,31 +1,182 @@
+import csv
+import json
+import os
 import sqlite3
+import sys
+import time as timer
 from datetime import datetime, timedelta
-from tabulate import tabulate
+from itertools import islice
 
+DB_FILE = "attendance.db"
+BUSY_TIMEOUT = 5000
+STATEMENT_CACHE = 256
+INGEST_BATCH = 50000
+REPORT_CHUNK = 1000
+REPORT_PAGE = 50
 
-conn = sqlite3.connect("attendance.db")
-cursor = conn.cursor()
+ROLLUP_REBUILD = '''
+DELETE FROM employee_monthly;
+DELETE FROM department_daily;
+DELETE FROM department_monthly;
+INSERT INTO employee_monthly(emp_id, month, hours, days)
+    SELECT emp_id, substr(date, 1, 7), SUM(working_hours), COUNT(*)
+    FROM attendance WHERE working_hours IS NOT NULL GROUP BY emp_id, substr(date, 1, 7);
+INSERT INTO department_daily(department, date, hours, days)
+    SELECT e.department, a.date, SUM(a.working_hours), COUNT(*)
+    FROM attendance a JOIN employees e ON a.emp_id = e.emp_id
+    WHERE a.working_hours IS NOT NULL GROUP BY e.department, a.date;
+INSERT INTO department_monthly(department, month, hours, days)
+    SELECT department, substr(date, 1, 7), SUM(hours), SUM(days)
+    FROM department_daily GROUP BY department, substr(date, 1, 7);
+'''
 
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS employees (
-    emp_id TEXT PRIMARY KEY,
-    name TEXT NOT NULL,
-    department TEXT NOT NULL
-)
-''')
 
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS attendance (
-    emp_id TEXT,
-    date TEXT,
-    check_in TEXT,
-    check_out TEXT,
-    working_hours REAL,
-    FOREIGN KEY(emp_id) REFERENCES employees(emp_id)
-)
-''')
+def _rollup_trigger_sql(row, sign):
+    # Adds (sign "+") or removes (sign "-") one attendance row's hours in every rollup table.
+    days = "1" if sign == "+" else "-1"
+    return f'''
+        INSERT INTO employee_monthly(emp_id, month, hours, days)
+            SELECT {row}.emp_id, substr({row}.date, 1, 7), {sign}{row}.working_hours, {days}
+            WHERE {row}.working_hours IS NOT NULL
+            ON CONFLICT(emp_id, month) DO UPDATE SET hours = hours + excluded.hours, days = days + excluded.days;
+        INSERT INTO department_daily(department, date, hours, days)
+            SELECT department, {row}.date, {sign}{row}.working_hours, {days}
+            FROM employees WHERE emp_id = {row}.emp_id AND {row}.working_hours IS NOT NULL
+            ON CONFLICT(department, date) DO UPDATE SET hours = hours + excluded.hours, days = days + excluded.days;
+        INSERT INTO department_monthly(department, month, hours, days)
+            SELECT department, substr({row}.date, 1, 7), {sign}{row}.working_hours, {days}
+            FROM employees WHERE emp_id = {row}.emp_id AND {row}.working_hours IS NOT NULL
+            ON CONFLICT(department, month) DO UPDATE SET hours = hours + excluded.hours, days = days + excluded.days;
+    '''
 
-conn.commit()
+
+MIGRATIONS = [
+    # 1: original schema
+    '''
+    CREATE TABLE IF NOT EXISTS employees (
+        emp_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        department TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS attendance (
+        emp_id TEXT,
+        date TEXT,
+        check_in TEXT,
+        check_out TEXT,
+        working_hours REAL,
+        FOREIGN KEY(emp_id) REFERENCES employees(emp_id)
+    );
+    ''',
+    # 2: one attendance row per employee per day, and a date index for the reports. Of each set of
+    # duplicates the most complete row stays (checked out, then most hours); the rest are kept aside
+    # in attendance_duplicates rather than dropped.
+    '''
+    CREATE TABLE IF NOT EXISTS attendance_duplicates (
+        original_rowid INTEGER,
+        emp_id TEXT,
+        date TEXT,
+        check_in TEXT,
+        check_out TEXT,
+        working_hours REAL
+    );
+    CREATE TEMP TABLE attendance_rank AS
+        SELECT rowid AS rid, ROW_NUMBER() OVER (
+            PARTITION BY emp_id, date ORDER BY check_out IS NULL, working_hours DESC, rowid) AS rank
+        FROM attendance;
+    INSERT INTO attendance_duplicates
+        SELECT rowid, emp_id, date, check_in, check_out, working_hours FROM attendance
+        WHERE rowid IN (SELECT rid FROM attendance_rank WHERE rank > 1);
+    DELETE FROM attendance WHERE rowid IN (SELECT rid FROM attendance_rank WHERE rank > 1);
+    DROP TABLE attendance_rank;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_attendance_emp_date ON attendance(emp_id, date);
+    CREATE INDEX IF NOT EXISTS idx_attendance_date ON attendance(date);
+    ''',
+    # 3: hour rollups kept current by triggers on attendance
+    f'''
+    CREATE TABLE IF NOT EXISTS employee_monthly (
+        emp_id TEXT NOT NULL,
+        month TEXT NOT NULL,
+        hours REAL NOT NULL,
+        days INTEGER NOT NULL,
+        PRIMARY KEY (emp_id, month)
+    );
+    CREATE TABLE IF NOT EXISTS department_daily (
+        department TEXT NOT NULL,
+        date TEXT NOT NULL,
+        hours REAL NOT NULL,
+        days INTEGER NOT NULL,
+        PRIMARY KEY (department, date)
+    );
+    CREATE TABLE IF NOT EXISTS department_monthly (
+        department TEXT NOT NULL,
+        month TEXT NOT NULL,
+        hours REAL NOT NULL,
+        days INTEGER NOT NULL,
+        PRIMARY KEY (department, month)
+    );
+    CREATE TRIGGER IF NOT EXISTS attendance_rollup_insert AFTER INSERT ON attendance BEGIN
+        {_rollup_trigger_sql("NEW", "+")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS attendance_rollup_update AFTER UPDATE OF emp_id, date, working_hours ON attendance BEGIN
+        {_rollup_trigger_sql("OLD", "-")}
+        {_rollup_trigger_sql("NEW", "+")}
+    END;
+    CREATE TRIGGER IF NOT EXISTS attendance_rollup_delete AFTER DELETE ON attendance BEGIN
+        {_rollup_trigger_sql("OLD", "-")}
+    END;
+    {ROLLUP_REBUILD}
+    ''',
+]
+
+
+def migrate(connection, target=len(MIGRATIONS)):
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    for number in range(version + 1, target + 1):
+        try:
+            connection.executescript(f"BEGIN; {MIGRATIONS[number - 1]} PRAGMA user_version = {number}; COMMIT;")
+        except sqlite3.Error:
+            connection.rollback()
+            raise
+        if number == 2:
+            moved = connection.execute("SELECT COUNT(*) FROM attendance_duplicates").fetchone()[0]
+            if moved:
+                print(f" Moved {moved} duplicate attendance rows to the attendance_duplicates table.")
+
+
+class AttendanceDB:
+    # Opens the database and applies migrations on first use rather than at import, so helpers
+    # such as valid_time or the report writers don't touch attendance.db. Statements are plain
+    # constants, so sqlite3's per-connection statement cache reuses their prepared form.
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self._connection = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, cached_statements=STATEMENT_CACHE)
+            migrate(connection)
+            self._connection = connection
+        return self._connection
+
+    def execute(self, sql, params=()):
+        return self.connection.execute(sql, params)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+db = AttendanceDB()
+
+
+def __getattr__(name):
+    # The module used to expose an open "conn"; keep that name working without connecting at import.
+    if name == "conn":
+        return db.connection
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def valid_time(time_str):
@@ -36,93 +187,364 @@ def valid_time(time_str):
         return False
 
 
+def valid_date(date_str):
+    # Dates are compared as text in SQL, so only the zero-padded form counts.
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m-%d") == date_str
+    except ValueError:
+        return False
+
+
+def month_range(month):
+    start = datetime.strptime(month, "%Y-%m")
+    end = (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+
+def _minutes(time_str):
+    hours, minutes = time_str.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def working_hours(check_in, check_out):
+    elapsed = _minutes(check_out) - _minutes(check_in)
+    if elapsed < 0:
+        return None
+    return round(elapsed * 60 / 3600, 2)
+
+
+def tune_for_bulk(connection):
+    # WAL lets readers keep working during long ingest transactions; NORMAL is durable in WAL mode
+    # except for the last transactions before a power loss.
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+
+
+def _flush_badges(connection, inserts, updates):
+    connection.executemany("INSERT INTO attendance(emp_id, date, check_in) VALUES (?, ?, ?)", inserts)
+    connection.executemany("UPDATE attendance SET check_out=?, working_hours=? WHERE emp_id=? AND date=?",
+                           [(out, hours, emp_id, date) for (emp_id, date), (out, hours) in updates.items()])
+    connection.commit()
+    inserts.clear()
+    updates.clear()
+
+
+def ingest_badge_log(connection, path, batch_size=INGEST_BATCH):
+    tune_for_bulk(connection)
+    days = {}
+    inserts, updates = [], {}
+    checked_in = checked_out = 0
+    rejected = []
+    with open(path, newline="") as f:
+        for line_no, row in enumerate(csv.reader(f), 1):
+            if not row or (line_no == 1 and row[0].strip().lower() == "emp_id"):
+                continue
+            if len(row) != 3:
+                rejected.append((line_no, row, "expected emp_id,timestamp,in/out"))
+                continue
+            emp_id, stamp, direction = (value.strip() for value in row)
+            direction = direction.lower()
+            try:
+                moment = datetime.fromisoformat(stamp)
+            except ValueError:
+                rejected.append((line_no, row, "invalid timestamp"))
+                continue
+            if not emp_id or direction not in ("in", "out"):
+                rejected.append((line_no, row, "missing employee ID or direction"))
+                continue
+            date, time = moment.date().isoformat(), f"{moment.hour:02d}:{moment.minute:02d}"
+            day = days.get(date)
+            if day is None:
+                day = days[date] = {emp: [check_in, check_out] for emp, check_in, check_out in connection.execute(
+                    "SELECT emp_id, check_in, check_out FROM attendance WHERE date=?", (date,))}
+            record = day.get(emp_id)
+            if direction == "in":
+                if record is not None:
+                    rejected.append((line_no, row, "already checked in that day"))
+                    continue
+                day[emp_id] = [time, None]
+                inserts.append((emp_id, date, time))
+                checked_in += 1
+            else:
+                if record is None:
+                    rejected.append((line_no, row, "no check-in found for that day"))
+                    continue
+                if record[0] is None:
+                    rejected.append((line_no, row, "check-in time missing"))
+                    continue
+                hours = working_hours(record[0], time)
+                if hours is None:
+                    rejected.append((line_no, row, "check-out before check-in"))
+                    continue
+                record[1] = time
+                updates[(emp_id, date)] = (time, hours)
+                checked_out += 1
+            if len(inserts) + len(updates) >= batch_size:
+                _flush_badges(connection, inserts, updates)
+    _flush_badges(connection, inserts, updates)
+    return checked_in, checked_out, rejected
+
+
+def rebuild_rollups(connection):
+    try:
+        connection.executescript(f"BEGIN; {ROLLUP_REBUILD} COMMIT;")
+    except sqlite3.Error:
+        connection.rollback()
+        raise
+
+
+DAILY_HEADERS = ["ID", "Name", "Dept", "In", "Out", "Hours"]
+MONTHLY_HEADERS = ["Date", "Check-in", "Check-out", "Hours"]
+RANGE_HEADERS = ["Date"] + DAILY_HEADERS
+
+DAILY_SQL = '''
+    SELECT a.emp_id, e.name, e.department, a.check_in, a.check_out, IFNULL(a.working_hours, 0)
+    FROM attendance a JOIN employees e ON a.emp_id = e.emp_id
+    WHERE a.date=?
+    ORDER BY a.emp_id
+'''
+MONTHLY_SQL = '''
+    SELECT date, check_in, check_out, IFNULL(working_hours, 0)
+    FROM attendance
+    WHERE emp_id=? AND date >= ? AND date < ?
+    ORDER BY date
+'''
+RANGE_SQL = '''
+    SELECT a.date, a.emp_id, e.name, e.department, a.check_in, a.check_out, IFNULL(a.working_hours, 0)
+    FROM attendance a JOIN employees e ON a.emp_id = e.emp_id
+    WHERE a.date >= ? AND a.date <= ?
+    ORDER BY a.date, a.emp_id
+'''
+
+
+def stream_rows(report_cursor, size=REPORT_CHUNK):
+    while True:
+        rows = report_cursor.fetchmany(size)
+        if not rows:
+            return
+        yield from rows
+
+
+def report_format(output, fmt=None):
+    if fmt:
+        return fmt
+    if output and output.lower().endswith(".csv"):
+        return "csv"
+    if output and output.lower().endswith(".jsonl"):
+        return "jsonl"
+    return "table"
+
+
+def write_report(rows, headers, out, fmt="table", pause=False, title=None):
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(headers)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    elif fmt == "jsonl":
+        for row in rows:
+            out.write(json.dumps(dict(zip(headers, row))) + "\n")
+            count += 1
+    else:
+        from tabulate import tabulate
+        while True:
+            page = list(islice(rows, REPORT_PAGE))
+            if not page:
+                break
+            if title and not count:
+                out.write(f"\n {title}:\n")
+            out.write(tabulate(page, headers=headers, tablefmt="grid") + "\n")
+            count += len(page)
+            if pause and len(page) == REPORT_PAGE and input(" Enter for more, q to stop: ").strip().lower() == "q":
+                break
+    return count
+
+
+def _tap(rows, on_row):
+    for row in rows:
+        on_row(row)
+        yield row
+
+
+def run_report(sql, params, headers, output=None, fmt=None, pause=False, title=None, on_row=None):
+    report_cursor = db.execute(sql, params)
+    rows = stream_rows(report_cursor)
+    if on_row:
+        rows = _tap(rows, on_row)
+    fmt = report_format(output, fmt)
+    try:
+        if output:
+            with open(output, "w", newline="") as out:
+                return write_report(rows, headers, out, fmt)
+        return write_report(rows, headers, sys.stdout, fmt, pause, title)
+    finally:
+        report_cursor.close()
+
+
+def insert_employee(connection, emp_id, name, dept):
+    if not (emp_id and name and dept):
+        raise ValueError("All fields are required.")
+    try:
+        connection.execute("INSERT INTO employees VALUES (?, ?, ?)", (emp_id, name, dept))
+        connection.commit()
+    except sqlite3.IntegrityError:
+        connection.rollback()
+        raise ValueError("Employee ID already exists.")
+
+
+def record_check_in(connection, emp_id, time, date=None):
+    if not valid_time(time):
+        raise ValueError("Invalid time format.")
+    if date and not valid_date(date):
+        raise ValueError("Invalid date format.")
+    date = date or datetime.today().strftime("%Y-%m-%d")
+    if connection.execute("SELECT 1 FROM attendance WHERE emp_id=? AND date=?", (emp_id, date)).fetchone():
+        raise ValueError("Already checked in today.")
+    try:
+        connection.execute("INSERT INTO attendance(emp_id, date, check_in) VALUES (?, ?, ?)", (emp_id, date, time))
+        connection.commit()
+    except sqlite3.IntegrityError:
+        # Another writer checked the same employee in between our SELECT and INSERT.
+        connection.rollback()
+        raise ValueError("Already checked in today.")
+
+
+def record_check_out(connection, emp_id, time, date=None):
+    if not valid_time(time):
+        raise ValueError("Invalid time format.")
+    if date and not valid_date(date):
+        raise ValueError("Invalid date format.")
+    date = date or datetime.today().strftime("%Y-%m-%d")
+    row = connection.execute("SELECT check_in FROM attendance WHERE emp_id=? AND date=?", (emp_id, date)).fetchone()
+    if not row:
+        raise ValueError("No check-in found for today.")
+    if row[0] is None:
+        raise ValueError("Check-in time missing.")
+    hours = working_hours(row[0], time)
+    if hours is None:
+        raise ValueError("Check-out can't be before check-in.")
+    connection.execute("UPDATE attendance SET check_out=?, working_hours=? WHERE emp_id=? AND date=?",
+                       (time, hours, emp_id, date))
+    connection.commit()
+    return hours
+
+
 def add_employee():
     emp_id = input("Enter Employee ID: ").strip()
     name = input("Enter Name: ").strip()
     dept = input("Enter Department: ").strip()
-    if not (emp_id and name and dept):
-        print(" All fields are required.")
-        return
     try:
-        cursor.execute("INSERT INTO employees VALUES (?, ?, ?)", (emp_id, name, dept))
-        conn.commit()
+        insert_employee(db.connection, emp_id, name, dept)
         print(" Employee added.")
-    except sqlite3.IntegrityError:
-        print(" Employee ID already exists.")
+    except ValueError as e:
+        print(f" {e}")
 
 def check_in():
     emp_id = input("Employee ID: ").strip()
     time = input("Check-in time (HH:MM): ").strip()
-    if not valid_time(time):
-        print(" Invalid time format.")
-        return
-    today = datetime.today().strftime("%Y-%m-%d")
-    cursor.execute("SELECT * FROM attendance WHERE emp_id=? AND date=?", (emp_id, today))
-    if cursor.fetchone():
-        print(" Already checked in today.")
-    else:
-        cursor.execute("INSERT INTO attendance(emp_id, date, check_in) VALUES (?, ?, ?)", (emp_id, today, time))
-        conn.commit()
+    try:
+        record_check_in(db.connection, emp_id, time)
         print(" Check-in recorded.")
+    except ValueError as e:
+        print(f" {e}")
 
 def check_out():
     emp_id = input("Employee ID: ").strip()
     time = input("Check-out time (HH:MM): ").strip()
-    if not valid_time(time):
-        print(" Invalid time format.")
-        return
-    today = datetime.today().strftime("%Y-%m-%d")
-    cursor.execute("SELECT check_in FROM attendance WHERE emp_id=? AND date=?", (emp_id, today))
-    row = cursor.fetchone()
-    if not row:
-        print(" No check-in found for today.")
-        return
-    if row[0] is None:
-        print(" Check-in time missing.")
-        return
-
-    check_in_time = datetime.strptime(row[0], "%H:%M")
-    check_out_time = datetime.strptime(time, "%H:%M")
-    if check_out_time < check_in_time:
-        print(" Check-out can't be before check-in.")
-        return
-    hours = round((check_out_time - check_in_time).seconds / 3600, 2)
+    try:
+        hours = record_check_out(db.connection, emp_id, time)
+        print(f" Checked out. Total hours: {hours} hrs")
+    except ValueError as e:
+        print(f" {e}")
 
-    cursor.execute("UPDATE attendance SET check_out=?, working_hours=? WHERE emp_id=? AND date=?",
-                   (time, hours, emp_id, today))
-    conn.commit()
-    print(f" Checked out. Total hours: {hours} hrs")
+def _report_output():
+    return input("Output file (.csv/.jsonl/.txt, blank for screen): ").strip() or None
 
 def daily_report():
     date = input("Enter date (YYYY-MM-DD): ").strip()
-    cursor.execute('''
-        SELECT a.emp_id, e.name, e.department, a.check_in, a.check_out, IFNULL(a.working_hours, 0)
-        FROM attendance a JOIN employees e ON a.emp_id = e.emp_id
-        WHERE a.date=?
-    ''', (date,))
-    rows = cursor.fetchall()
-    if rows:
-        print("\n Daily Report:")
-        print(tabulate(rows, headers=["ID", "Name", "Dept", "In", "Out", "Hours"], tablefmt="grid"))
-    else:
+    output = _report_output()
+    count = run_report(DAILY_SQL, (date,), DAILY_HEADERS, output, pause=True, title="Daily Report")
+    if not count:
         print(" No attendance records for that date.")
+    elif output:
+        print(f" Wrote {count} rows to {output}.")
 
 def monthly_report():
     emp_id = input("Enter Employee ID: ").strip()
     month = input("Enter month (YYYY-MM): ").strip()
-    cursor.execute('''
-        SELECT date, check_in, check_out, IFNULL(working_hours, 0)
-        FROM attendance
-        WHERE emp_id=? AND date LIKE ?
-    ''', (emp_id, f"{month}-%"))
-    rows = cursor.fetchall()
+    try:
+        start, end = month_range(month)
+    except ValueError:
+        print(" Invalid month format.")
+        return
+    output = _report_output()
+    total = 0
+
+    def add_hours(row):
+        nonlocal total
+        total += row[3]
+
+    count = run_report(MONTHLY_SQL, (emp_id, start, end), MONTHLY_HEADERS, output, pause=True,
+                       title="Monthly Report", on_row=add_hours)
+    if not count:
+        print(" No records for given employee and month.")
+        return
+    if output:
+        print(f" Wrote {count} rows to {output}.")
+    print(f" Total Working Hours in {month}: {round(total, 2)} hrs")
+
+def department_summary():
+    period = input("Enter date (YYYY-MM-DD) or month (YYYY-MM): ").strip()
+    if len(period) == 7:
+        table, column = "department_monthly", "month"
+    else:
+        table, column = "department_daily", "date"
+    rows = db.execute(f"SELECT department, days, ROUND(hours, 2) FROM {table} WHERE {column}=? AND days > 0 "
+                      "ORDER BY department", (period,)).fetchall()
     if rows:
-        total_hours = sum(row[3] for row in rows)
-        print("\n Monthly Report:")
-        print(tabulate(rows, headers=["Date", "Check-in", "Check-out", "Hours"], tablefmt="grid"))
-        print(f" Total Working Hours in {month}: {round(total_hours, 2)} hrs")
+        print(f"\n Department Summary for {period}:")
+        from tabulate import tabulate
+        print(tabulate(rows, headers=["Dept", "Attendance Days", "Hours"], tablefmt="grid"))
+        print(f" Organization Total: {round(sum(row[2] for row in rows), 2)} hrs over {sum(row[1] for row in rows)} attendance days")
     else:
-        print(" No records for given employee and month.")
+        print(" No completed attendance for that period.")
+
+def employee_month_total():
+    emp_id = input("Enter Employee ID: ").strip()
+    month = input("Enter month (YYYY-MM): ").strip()
+    row = db.execute("SELECT days, hours FROM employee_monthly WHERE emp_id=? AND month=?", (emp_id, month)).fetchone()
+    if row and row[0] > 0:
+        print(f" {emp_id} worked {round(row[1], 2)} hrs over {row[0]} days in {month}.")
+    else:
+        print(" No completed attendance for given employee and month.")
+
+def rebuild_summaries():
+    rebuild_rollups(db.connection)
+    print(" Summary tables rebuilt.")
+
+def import_badge_log():
+    path = input("Badge log CSV (emp_id,timestamp,in/out): ").strip()
+    if not os.path.exists(path):
+        print(" File not found.")
+        return
+    start = timer.perf_counter()
+    checked_in, checked_out, rejected = ingest_badge_log(db.connection, path)
+    elapsed = timer.perf_counter() - start
+    total = checked_in + checked_out + len(rejected)
+    print(f" Imported {checked_in} check-ins and {checked_out} check-outs in {elapsed:.2f}s "
+          f"({total / max(elapsed, 1e-9):,.0f} rows/sec).")
+    if rejected:
+        reject_file = path + ".rejected.csv"
+        with open(reject_file, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["line", "emp_id", "timestamp", "direction", "reason"])
+            for line_no, row, reason in rejected:
+                writer.writerow([line_no] + (row + ["", "", ""])[:3] + [reason])
+        print(f" Rejected {len(rejected)} rows (details in {reject_file}):")
+        for line_no, row, reason in rejected[:10]:
+            print(f"   line {line_no}: {','.join(row)} - {reason}")
 
 def menu():
     print("\n EMPLOYEE ATTENDANCE TRACKER")
@@ -131,12 +553,16 @@ def menu():
     print("3. Check-Out")
     print("4. Daily Report")
     print("5. Monthly Report")
-    print("6. Exit")
+    print("6. Import Badge Log")
+    print("7. Department Summary")
+    print("8. Employee Month Total")
+    print("9. Rebuild Summary Tables")
+    print("10. Exit")
 
 def main():
     while True:
         menu()
-        choice = input("Choose (1-6): ").strip()
+        choice = input("Choose (1-10): ").strip()
         if choice == "1":
             add_employee()
         elif choice == "2":
@@ -148,10 +574,408 @@ def main():
         elif choice == "5":
             monthly_report()
         elif choice == "6":
+            import_badge_log()
+        elif choice == "7":
+            department_summary()
+        elif choice == "8":
+            employee_month_total()
+        elif choice == "9":
+            rebuild_summaries()
+        elif choice == "10":
             print(" Exiting. Stay punctual!")
             break
         else:
             print(" Invalid option.")
 
+def _seed_benchmark_db(connection, employees, years):
+    connection.executemany("INSERT INTO employees VALUES (?, ?, ?)",
+                           ((f"E{i:05d}", f"Employee {i}", f"Dept {i % 20}") for i in range(employees)))
+    first = datetime(2024 - years + 1, 1, 1)
+    days = [first + timedelta(days=d) for d in range(365 * years)]
+    workdays = [day.strftime("%Y-%m-%d") for day in days if day.weekday() < 5]
+    connection.executemany(
+        "INSERT INTO attendance VALUES (?, ?, '09:00', '17:30', 8.5)",
+        ((f"E{i:05d}", day) for day in workdays for i in range(employees)))
+    connection.commit()
+    return len(workdays) * employees
+
+
+def benchmark_indexes(employees=2000, years=3, repeat=20):
+    queries = [
+        ("check-in lookup", "SELECT * FROM attendance WHERE emp_id=? AND date=?", ("E01234", "2023-06-14")),
+        ("daily report", "SELECT a.emp_id, e.name, e.department, a.check_in, a.check_out, IFNULL(a.working_hours, 0) "
+                         "FROM attendance a JOIN employees e ON a.emp_id = e.emp_id WHERE a.date=?", ("2023-06-14",)),
+        ("monthly (LIKE)", "SELECT date, check_in, check_out, IFNULL(working_hours, 0) FROM attendance "
+                           "WHERE emp_id=? AND date LIKE ?", ("E01234", "2023-06-%")),
+        ("monthly (range)", "SELECT date, check_in, check_out, IFNULL(working_hours, 0) FROM attendance "
+                            "WHERE emp_id=? AND date >= ? AND date < ?", ("E01234",) + month_range("2023-06")),
+    ]
+    for label, target in (("original schema", 1), ("indexed schema", len(MIGRATIONS))):
+        connection = sqlite3.connect(":memory:")
+        migrate(connection, 1)
+        rows = _seed_benchmark_db(connection, employees, years)
+        start = timer.perf_counter()
+        migrate(connection, target)
+        print(f"\n {label}: {rows} rows, migration {timer.perf_counter() - start:.2f}s")
+        for name, sql, params in queries:
+            start = timer.perf_counter()
+            for _ in range(repeat):
+                connection.execute(sql, params).fetchall()
+            print(f"   {name:<16} {(timer.perf_counter() - start) / repeat * 1000:9.3f} ms")
+        connection.close()
+
+
+def benchmark_ingest(employees=5000, days=20):
+    import tempfile
+    workdir = tempfile.mkdtemp()
+    log_path = os.path.join(workdir, "badges.csv")
+    with open(log_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["emp_id", "timestamp", "direction"])
+        for d in range(days):
+            day = (datetime(2024, 1, 1) + timedelta(days=d)).strftime("%Y-%m-%d")
+            writer.writerows((f"E{i:05d}", f"{day} 08:{i % 60:02d}", "in") for i in range(employees))
+            writer.writerows((f"E{i:05d}", f"{day} 17:{i % 60:02d}", "out") for i in range(employees))
+    connection = sqlite3.connect(os.path.join(workdir, "attendance.db"))
+    migrate(connection)
+    start = timer.perf_counter()
+    checked_in, checked_out, rejected = ingest_badge_log(connection, log_path)
+    elapsed = timer.perf_counter() - start
+    rows = checked_in + checked_out + len(rejected)
+    print(f"\n badge ingest: {rows} rows in {elapsed:.2f}s = {rows / elapsed:,.0f} rows/sec ({len(rejected)} rejected)")
+    connection.close()
+
+
+def benchmark_startup(runs=5):
+    import statistics
+    import subprocess
+    import tempfile
+    # Each run is a fresh interpreter in an empty directory, so the first command includes creating
+    # and migrating attendance.db.
+    probe = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})\n"
+        "import employee_adandence_tracker as t\n"
+        "imported = time.perf_counter()\n"
+        "t.valid_time('09:00')\n"
+        "helper = time.perf_counter()\n"
+        "t.run_report(t.DAILY_SQL, ('2024-01-01',), t.DAILY_HEADERS)\n"
+        "done = time.perf_counter()\n"
+        "print(imported - start, helper - imported, done - helper)\n"
+    )
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", probe], cwd=tempfile.mkdtemp(),
+                                capture_output=True, text=True, check=True)
+        samples.append([float(value) for value in result.stdout.split()])
+    imported, helper, first = (statistics.median(column) * 1000 for column in zip(*samples))
+    print(f"\n startup (median of {runs}): import {imported:.1f} ms, valid_time {helper:.3f} ms, "
+          f"first report incl. schema setup {first:.1f} ms")
+
+
+def open_connection(path=DB_FILE):
+    connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT / 1000, check_same_thread=False,
+                                 cached_statements=STATEMENT_CACHE)
+    connection.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT}")
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class BadRequest(Exception):
+    pass
+
+
+def _param(params, key, required=False):
+    # JSON bodies can carry any type; only strings reach the write rules and SQL.
+    value = params.get(key)
+    if value is None:
+        if required:
+            raise KeyError(key)
+        return ""
+    if not isinstance(value, str):
+        raise BadRequest(f"Parameter {key} must be a string.")
+    return value.strip()
+
+
+def _date_param(params, key, required=False):
+    value = _param(params, key, required)
+    if value and not valid_date(value):
+        raise BadRequest(f"Invalid {key}, expected YYYY-MM-DD.")
+    return value
+
+
+def _api_add_employee(connection, params):
+    emp_id = _param(params, "emp_id")
+    insert_employee(connection, emp_id, _param(params, "name"), _param(params, "department"))
+    return {"emp_id": emp_id}
+
+
+def _api_check_in(connection, params):
+    emp_id = _param(params, "emp_id")
+    time = _param(params, "time") or datetime.now().strftime("%H:%M")
+    record_check_in(connection, emp_id, time, _date_param(params, "date"))
+    return {"emp_id": emp_id, "check_in": time}
+
+
+def _api_check_out(connection, params):
+    emp_id = _param(params, "emp_id")
+    time = _param(params, "time") or datetime.now().strftime("%H:%M")
+    hours = record_check_out(connection, emp_id, time, _date_param(params, "date"))
+    return {"emp_id": emp_id, "check_out": time, "working_hours": hours}
+
+
+def _api_daily_report(connection, params):
+    rows = connection.execute(DAILY_SQL, (_date_param(params, "date", True),)).fetchall()
+    return {"rows": [dict(zip(DAILY_HEADERS, row)) for row in rows]}
+
+
+def _api_monthly_report(connection, params):
+    emp_id = _param(params, "emp_id", True)
+    try:
+        start, end = month_range(_param(params, "month", True))
+    except ValueError:
+        raise BadRequest("Invalid month, expected YYYY-MM.")
+    rows = connection.execute(MONTHLY_SQL, (emp_id, start, end)).fetchall()
+    return {"rows": [dict(zip(MONTHLY_HEADERS, row)) for row in rows],
+            "total_hours": round(sum(row[3] for row in rows), 2)}
+
+
+class AttendanceService:
+    # Local HTTP/JSON front end for kiosks. Reads run on a small thread pool, each with a pooled
+    # connection; all writes go through one single-threaded executor, so concurrent check-ins queue
+    # in-process instead of contending for SQLite's write lock.
+    ROUTES = {
+        ("POST", "/employees"): ("write", _api_add_employee),
+        ("POST", "/check-in"): ("write", _api_check_in),
+        ("POST", "/check-out"): ("write", _api_check_out),
+        ("GET", "/reports/daily"): ("read", _api_daily_report),
+        ("GET", "/reports/monthly"): ("read", _api_monthly_report),
+    }
+    REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 409: "Conflict",
+               500: "Internal Server Error", 503: "Service Unavailable"}
+
+    def __init__(self, path=DB_FILE, readers=4):
+        import queue
+        from concurrent.futures import ThreadPoolExecutor
+        setup = open_connection(path)
+        migrate(setup)
+        setup.close()
+        self._pool = queue.Queue()
+        for _ in range(readers + 1):
+            self._pool.put(open_connection(path))
+        self._executors = {"read": ThreadPoolExecutor(readers), "write": ThreadPoolExecutor(1)}
+
+    def _call(self, handler, params):
+        connection = self._pool.get()
+        try:
+            return handler(connection, params)
+        finally:
+            self._pool.put(connection)
+
+    async def dispatch(self, method, target, body):
+        import asyncio
+        from urllib.parse import parse_qs, urlsplit
+        url = urlsplit(target)
+        route = self.ROUTES.get((method, url.path))
+        if route is None:
+            return 404, {"error": "Unknown endpoint."}
+        kind, handler = route
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if body:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                payload = None
+            if not isinstance(payload, dict):
+                return 400, {"error": "Request body must be a JSON object."}
+            params.update(payload)
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executors[kind], self._call, handler, params)
+            return 200, result
+        except KeyError as e:
+            return 400, {"error": f"Missing parameter {e.args[0]}."}
+        except BadRequest as e:
+            return 400, {"error": str(e)}
+        except ValueError as e:
+            return 409 if kind == "write" else 400, {"error": str(e)}
+        except sqlite3.OperationalError as e:
+            return 503, {"error": str(e)}
+        except Exception as e:
+            # Never drop a kiosk's connection without an answer.
+            return 500, {"error": f"Internal error ({type(e).__name__})."}
+
+    async def handle(self, reader, writer):
+        import asyncio
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self.dispatch(method, target, body)
+                data = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status} {self.REASONS[status]}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        for executor in self._executors.values():
+            executor.shutdown()
+        while not self._pool.empty():
+            self._pool.get().close()
+
+
+async def _serve(host, port, path):
+    import asyncio
+    service = AttendanceService(path)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f" Attendance service listening on http://{host}:{port} (database {path})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+async def _request(reader, writer, method, target, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def _kiosk(port, kiosk, employees, latencies, failures):
+    import asyncio
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for i in range(employees):
+        emp_id = f"K{kiosk:03d}-{i:05d}"
+        steps = [
+            ("add", "POST", "/employees", {"emp_id": emp_id, "name": f"Employee {i}", "department": f"Dept {kiosk % 10}"}),
+            ("check-in", "POST", "/check-in", {"emp_id": emp_id, "time": "09:00"}),
+            ("check-out", "POST", "/check-out", {"emp_id": emp_id, "time": "17:30"}),
+            ("report", "GET", f"/reports/monthly?emp_id={emp_id}&month={datetime.today():%Y-%m}", None),
+        ]
+        for name, method, target, payload in steps:
+            start = timer.perf_counter()
+            status, _ = await _request(reader, writer, method, target, payload)
+            latencies.setdefault(name, []).append(timer.perf_counter() - start)
+            if status != 200:
+                failures.append((name, status))
+    writer.close()
+
+
+async def _load_test(kiosks, employees):
+    import asyncio
+    import statistics
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "attendance.db")
+    service = AttendanceService(path)
+    server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    latencies, failures = {}, []
+    start = timer.perf_counter()
+    async with server:
+        await asyncio.gather(*(_kiosk(port, k, employees, latencies, failures) for k in range(kiosks)))
+    elapsed = timer.perf_counter() - start
+    service.close()
+    total = sum(len(values) for values in latencies.values())
+    print(f"\n load test: {kiosks} kiosks, {total} requests in {elapsed:.2f}s = {total / elapsed:,.0f} req/sec, "
+          f"{len(failures)} failures")
+    for name, values in latencies.items():
+        cuts = statistics.quantiles(values, n=100)
+        print(f"   {name:<10} p50 {cuts[49] * 1000:7.2f} ms   p99 {cuts[98] * 1000:7.2f} ms")
+
+
+def service_command(argv):
+    import argparse
+    import asyncio
+    parser = argparse.ArgumentParser(prog="employee_adandence_tracker.py")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the kiosk HTTP service")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--db", default=DB_FILE)
+    load = commands.add_parser("loadtest", help="run the service against a scratch database and report latency")
+    load.add_argument("--kiosks", type=int, default=50)
+    load.add_argument("--employees", type=int, default=40, help="employees processed per kiosk")
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "serve":
+            asyncio.run(_serve(args.host, args.port, args.db))
+        else:
+            asyncio.run(_load_test(args.kiosks, args.employees))
+    except KeyboardInterrupt:
+        pass
+
+
+def report_command(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog="employee_adandence_tracker.py report")
+    parser.add_argument("--output", help="write to this file instead of the screen")
+    parser.add_argument("--format", choices=["table", "csv", "jsonl"], help="defaults from the --output extension")
+    kinds = parser.add_subparsers(dest="kind", required=True)
+    kinds.add_parser("daily").add_argument("date", help="YYYY-MM-DD")
+    monthly = kinds.add_parser("monthly")
+    monthly.add_argument("emp_id")
+    monthly.add_argument("month", help="YYYY-MM")
+    date_range = kinds.add_parser("range")
+    date_range.add_argument("start", help="first date, YYYY-MM-DD")
+    date_range.add_argument("end", help="last date, YYYY-MM-DD")
+    args = parser.parse_args(argv)
+    if args.kind == "daily":
+        if not valid_date(args.date):
+            parser.error(f"invalid date {args.date!r}, expected YYYY-MM-DD")
+        sql, params, headers = DAILY_SQL, (args.date,), DAILY_HEADERS
+    elif args.kind == "monthly":
+        try:
+            month = month_range(args.month)
+        except ValueError:
+            parser.error(f"invalid month {args.month!r}, expected YYYY-MM")
+        sql, params, headers = MONTHLY_SQL, (args.emp_id,) + month, MONTHLY_HEADERS
+    else:
+        for date in (args.start, args.end):
+            if not valid_date(date):
+                parser.error(f"invalid date {date!r}, expected YYYY-MM-DD")
+        if args.start > args.end:
+            parser.error("start date is after end date")
+        sql, params, headers = RANGE_SQL, (args.start, args.end), RANGE_HEADERS
+    count = run_report(sql, params, headers, args.output, args.format)
+    print(f" {count} rows", file=sys.stderr)
+
+
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["bench"]:
+        benchmark_startup()
+        benchmark_indexes()
+        benchmark_ingest()
+    elif sys.argv[1:2] == ["report"]:
+        report_command(sys.argv[2:])
+    elif sys.argv[1:2] in (["serve"], ["loadtest"]):
+        service_command(sys.argv[1:])
+    else:
+        main()
@@ -1,8 +1,23 @@
-import json, os
+import json, os, sys, time, csv, math, sqlite3
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from fpdf import FPDF
 
 HISTORY_FILE = "emi_history.json"
+HISTORY_DB = "emi_history.db"
+HISTORY_FIELDS = ["date", "principal", "rate", "tenure", "emi", "interest", "total"]
+GRID_COLUMNS = ["principal", "rate", "tenure", "emi", "interest", "total"]
+SCHEDULE_COLUMNS = ["month", "rate", "payment", "principal", "interest", "prepayment", "balance"]
+PAID_OFF = 0.005
+PDF_CHUNK = 200
+STANDARD_RATES = [6 + 0.25 * i for i in range(41)]
+STANDARD_TENURES = list(range(12, 361, 12))
+QUOTE_CACHE_SIZE = 16384
+_db = None
+_factors = {}
+_quotes = OrderedDict()
+quote_stats = {"hits": 0, "misses": 0, "factor_hits": 0, "factor_misses": 0}
 
 
 def validate_input(prompt, type_=float, min_val=0):
@@ -15,56 +30,357 @@ def validate_input(prompt, type_=float, min_val=0):
         print(f" Invalid input. Must be > {min_val}")
         return None
 
-def calculate_emi(P, R, N):
+def monthly_emi(P, R, N):
     monthly_rate = R / (12 * 100)
-    emi = P * monthly_rate * (1 + monthly_rate)**N / ((1 + monthly_rate)**N - 1)
+    if monthly_rate == 0:
+        return P / N
+    return P * monthly_rate * (1 + monthly_rate)**N / ((1 + monthly_rate)**N - 1)
+
+def calculate_emi(P, R, N):
+    emi = monthly_emi(P, R, N)
     total_payment = round(emi * N, 2)
     total_interest = round(total_payment - P, 2)
     return round(emi, 2), total_interest, total_payment
 
-def save_to_history(entry):
-    history = []
-    if os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE) as f:
-            history = json.load(f)
-    history.append(entry)
-    with open(HISTORY_FILE, "w") as f:
-        json.dump(history, f, indent=4)
+def _annuity_terms(R, N):
+    monthly_rate = R / (12 * 100)
+    growth = (1 + monthly_rate)**N
+    return monthly_rate, growth, growth - 1
 
-def retrieve_by_date():
-    date = input("Enter date (YYYY-MM-DD): ").strip()
+def precompute_factors(rates=STANDARD_RATES, tenures=STANDARD_TENURES):
+    for R in rates:
+        for N in tenures:
+            _factors[(R, N)] = _annuity_terms(R, N)
+
+def quote_emi(P, R, N):
+    key = (P, R, N)
+    quote = _quotes.get(key)
+    if quote is not None:
+        _quotes.move_to_end(key)
+        quote_stats["hits"] += 1
+        return quote
+    quote_stats["misses"] += 1
+    if not _factors:
+        precompute_factors()
+    terms = _factors.get((R, N))
+    if terms is None:
+        quote_stats["factor_misses"] += 1
+        terms = _annuity_terms(R, N)
+    else:
+        quote_stats["factor_hits"] += 1
+    monthly_rate, growth, growth_less_one = terms
+    # Same operation order as monthly_emi, so the rounded figures match calculate_emi exactly.
+    emi = P / N if monthly_rate == 0 else P * monthly_rate * growth / growth_less_one
+    total_payment = round(emi * N, 2)
+    quote = (round(emi, 2), round(total_payment - P, 2), total_payment)
+    _quotes[key] = quote
+    if len(_quotes) > QUOTE_CACHE_SIZE:
+        _quotes.popitem(last=False)
+    return quote
+
+def quote_cache_info():
+    lookups = quote_stats["hits"] + quote_stats["misses"]
+    return {**quote_stats, "size": len(_quotes), "capacity": QUOTE_CACHE_SIZE, "factors": len(_factors),
+            "hit_rate": quote_stats["hits"] / lookups if lookups else 0.0}
+
+def amortization_schedule(P, R, N, prepayments=None, rate_changes=None):
+    # prepayments: {month: amount} paid after that month's EMI; the EMI stays and the loan ends sooner.
+    # rate_changes: {month: annual rate} applied from that month; the EMI is recomputed over the remaining tenure.
+    prepayments = prepayments or {}
+    rate_changes = rate_changes or {}
+    balance, rate = P, R
+    emi = monthly_emi(P, R, N)
+    for month in range(1, N + 1):
+        if month in rate_changes:
+            rate = rate_changes[month]
+            emi = monthly_emi(balance, rate, N - month + 1)
+        interest = balance * rate / (12 * 100)
+        principal = min(emi - interest, balance)
+        if balance - principal < PAID_OFF:
+            principal = balance
+        balance -= principal
+        prepaid = min(prepayments.get(month, 0), balance)
+        balance -= prepaid
+        yield {
+            "month": month,
+            "rate": rate,
+            "payment": principal + interest,
+            "principal": principal,
+            "interest": interest,
+            "prepayment": prepaid,
+            "balance": balance
+        }
+        if balance <= 0:
+            break
+
+def _advance(balance, monthly_rate, emi, months):
+    # Balance and interest after `months` level payments, without iterating.
+    if balance <= 0 or months <= 0:
+        return balance, 0.0
+    if monthly_rate == 0:
+        after = balance - emi * months
+    else:
+        growth = (1 + monthly_rate)**months
+        after = balance * growth - emi * (growth - 1) / monthly_rate
+    if after >= PAID_OFF:
+        return after, emi * months - (balance - after)
+    # Paid off inside this stretch: find the payoff month and charge interest only up to it.
+    if monthly_rate == 0:
+        payoff = math.ceil(balance / emi)
+    else:
+        payoff = math.ceil(math.log(emi / (emi - balance * monthly_rate)) / math.log(1 + monthly_rate))
+    payoff = max(1, min(payoff, months))
+    before, interest = _advance(balance, monthly_rate, emi, payoff - 1)
+    while payoff > 1 and before < PAID_OFF:
+        payoff -= 1
+        before, interest = _advance(balance, monthly_rate, emi, payoff - 1)
+    return 0.0, interest + before * monthly_rate
+
+def loan_position(P, R, N, month, prepayments=None, rate_changes=None):
+    # Balance and cumulative interest after `month` payments; cost grows with the number of events, not months.
+    prepayments = prepayments or {}
+    rate_changes = rate_changes or {}
+    month = min(month, N)
+    balance, rate, interest = P, R, 0.0
+    emi = monthly_emi(P, R, N)
+    done = 0
+    for event in sorted(m for m in set(prepayments) | set(rate_changes) if m <= month):
+        balance, paid = _advance(balance, rate / 1200, emi, event - 1 - done)
+        interest += paid
+        if event in rate_changes and balance > 0:
+            rate = rate_changes[event]
+            emi = monthly_emi(balance, rate, N - event + 1)
+        balance, paid = _advance(balance, rate / 1200, emi, 1)
+        interest += paid
+        balance -= min(prepayments.get(event, 0), balance)
+        done = event
+    balance, paid = _advance(balance, rate / 1200, emi, month - done)
+    return balance, interest + paid
+
+def export_schedule_csv(schedule, filename):
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SCHEDULE_COLUMNS)
+        for row in schedule:
+            writer.writerow([row["month"], row["rate"]] + [round(row[key], 2) for key in SCHEDULE_COLUMNS[2:]])
+
+def parse_events(text):
+    # "12:50000,24:25000" -> {12: 50000.0, 24: 25000.0}
+    events = {}
+    for part in text.split(","):
+        if part.strip():
+            month, value = part.split(":")
+            month, value = int(month), float(value)
+            if month <= 0 or value < 0:
+                raise ValueError
+            events[month] = value
+    return events
+
+def emi_grid(principals, rates, tenures):
+    import numpy as np
+    P, R, N = (axis.ravel() for axis in np.meshgrid(np.asarray(principals, dtype=float),
+                                                      np.asarray(rates, dtype=float),
+                                                      np.asarray(tenures, dtype=float), indexing="ij"))
+    monthly_rate = R / (12 * 100)
+    growth = (1 + monthly_rate)**N
+    # Zero-rate loans are plain division; the annuity formula would be 0/0 there.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        emi = np.where(monthly_rate == 0, P / N, P * monthly_rate * growth / (growth - 1))
+    total_payment = np.round(emi * N, 2)
+    return {
+        "principal": P,
+        "rate": R,
+        "tenure": N.astype(int),
+        "emi": np.round(emi, 2),
+        "interest": np.round(total_payment - P, 2),
+        "total": total_payment
+    }
+
+def select_scenarios(grid, max_emi=None, sort_by="emi", descending=False):
+    import numpy as np
+    rows = np.arange(len(grid["emi"]))
+    if max_emi is not None:
+        rows = rows[grid["emi"] <= max_emi]
+    order = np.argsort(grid[sort_by][rows], kind="stable")
+    rows = rows[order[::-1] if descending else order]
+    return {key: column[rows] for key, column in grid.items()}
+
+def export_grid_csv(grid, filename):
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(GRID_COLUMNS)
+        writer.writerows(zip(*(grid[key].tolist() for key in GRID_COLUMNS)))
+
+def parse_values(text, type_=float):
+    # "a,b,c" lists values; "start:stop:step" is an inclusive range.
+    if ":" in text:
+        parts = text.split(":")
+        start, stop, step = (type_(part) for part in parts)
+        if step <= 0:
+            raise ValueError
+        # start + i * step rounded to the inputs' decimals, so 6:9:0.1 ends at 9.0, not 8.99999999999999.
+        decimals = max(len(part.strip().partition(".")[2]) for part in parts)
+        count = math.floor(round((stop - start) / step, 9)) + 1
+        return [type_(round(start + i * step, decimals)) for i in range(max(count, 0))]
+    return [type_(part) for part in text.split(",") if part.strip()]
+
+def history_db():
+    global _db
+    if _db is None:
+        _db = sqlite3.connect(HISTORY_DB)
+        _db.row_factory = sqlite3.Row
+        _db.execute("""CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            principal REAL,
+            rate REAL,
+            tenure INTEGER,
+            emi REAL,
+            interest REAL,
+            total REAL
+        )""")
+        _db.execute("CREATE INDEX IF NOT EXISTS idx_history_date ON history(date)")
+        migrate_json_history(_db)
+    return _db
+
+def migrate_json_history(db):
+    # One-time import of the old whole-file JSON history; the file is kept as .migrated.
     if not os.path.exists(HISTORY_FILE):
-        print(" No history found.")
-        return
+        return 0
     with open(HISTORY_FILE) as f:
         history = json.load(f)
-    matches = [h for h in history if h["date"] == date]
+    with db:
+        db.executemany("INSERT INTO history (date, principal, rate, tenure, emi, interest, total) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       ([h.get(key) for key in HISTORY_FIELDS] for h in history))
+    os.replace(HISTORY_FILE, HISTORY_FILE + ".migrated")
+    print(f" Migrated {len(history)} history records from {HISTORY_FILE} to {HISTORY_DB}.")
+    return len(history)
+
+def save_to_history(entry):
+    db = history_db()
+    with db:
+        db.execute("INSERT INTO history (date, principal, rate, tenure, emi, interest, total) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                   [entry.get(key) for key in HISTORY_FIELDS])
+
+def history_between(start, end=None):
+    rows = history_db().execute("SELECT * FROM history WHERE date BETWEEN ? AND ? ORDER BY date, id",
+                                (start, end or start))
+    for row in rows:
+        yield dict(row)
+
+def parse_date_range(text):
+    start, _, end = text.partition(":")
+    start, end = start.strip(), end.strip() or start.strip()
+    for day in (start, end):
+        datetime.strptime(day, "%Y-%m-%d")
+    return start, end
+
+def retrieve_by_date():
+    try:
+        start, end = parse_date_range(input("Enter date or range (YYYY-MM-DD or YYYY-MM-DD:YYYY-MM-DD): "))
+    except ValueError:
+        print(" Invalid date format.")
+        return
+    matches = list(history_between(start, end))
     if matches:
         for i, h in enumerate(matches, 1):
-            print(f"\n[{i}] Principal: ₹{h['principal']}, Interest: {h['rate']}%, Tenure: {h['tenure']} months")
+            print(f"\n[{i}] {h['date']} Principal: ₹{h['principal']}, Interest: {h['rate']}%, Tenure: {h['tenure']} months")
             print(f"    EMI: ₹{h['emi']}, Total Interest: ₹{h['interest']}, Total Payment: ₹{h['total']}")
     else:
         print(" No records found for this date.")
 
-def export_to_txt(entry):
-    filename = f"emi_{entry['date'].replace('-', '')}.txt"
+def _schedule_line(row):
+    return (f"{row['month']:>5} {row['rate']:>6} {row['payment']:>12.2f} {row['principal']:>12.2f} "
+            f"{row['interest']:>12.2f} {row['prepayment']:>12.2f} {row['balance']:>14.2f}")
+
+def unique_filename(stem, ext, directory=""):
+    # Reserve the name with O_EXCL so exports on the same day never overwrite each other.
+    n = 1
+    while True:
+        name = os.path.join(directory, f"{stem}.{ext}" if n == 1 else f"{stem}_{n}.{ext}")
+        try:
+            os.close(os.open(name, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return name
+        except FileExistsError:
+            n += 1
+
+def export_to_txt(entry, schedule=None):
+    filename = unique_filename(f"emi_{entry['date'].replace('-', '')}", "txt")
     with open(filename, "w") as f:
         f.write(" Loan EMI Calculation\n")
         for key, value in entry.items():
             f.write(f"{key.capitalize()}: {value}\n")
+        if schedule is not None:
+            f.write("\n Amortization Schedule\n")
+            f.write(f"{'Month':>5} {'Rate':>6} {'Payment':>12} {'Principal':>12} {'Interest':>12} {'Prepayment':>12} {'Balance':>14}\n")
+            for row in schedule:
+                f.write(_schedule_line(row) + "\n")
     print(f" Exported to {filename}")
 
-def export_to_pdf(entry):
-    pdf = FPDF()
+def _add_statement(pdf, entry):
     pdf.add_page()
     pdf.set_font("Arial", size=12)
     pdf.cell(200, 10, "Loan EMI Calculation", ln=True, align='C')
     for key, val in entry.items():
         pdf.cell(200, 10, f"{key.capitalize()}: {val}", ln=True)
-    filename = f"emi_{entry['date'].replace('-', '')}.pdf"
+
+def export_to_pdf(entry, schedule=None):
+    pdf = FPDF()
+    _add_statement(pdf, entry)
+    if schedule is not None:
+        pdf.cell(200, 10, "Amortization Schedule", ln=True, align='C')
+        pdf.set_font("Courier", size=8)
+        pdf.cell(200, 5, f"{'Month':>5} {'Rate':>6} {'Payment':>12} {'Principal':>12} {'Interest':>12} {'Prepayment':>12} {'Balance':>14}", ln=True)
+        for row in schedule:
+            pdf.cell(200, 5, _schedule_line(row), ln=True)
+    filename = unique_filename(f"emi_{entry['date'].replace('-', '')}", "pdf")
     pdf.output(filename)
     print(f" Exported to {filename}")
 
+def _render_pdfs(jobs):
+    # Runs in a worker process: each job is (filename, entries) and becomes one PDF, a page per entry.
+    pages = 0
+    for filename, entries in jobs:
+        pdf = FPDF()
+        for entry in entries:
+            _add_statement(pdf, entry)
+        pdf.output(filename)
+        pages += len(entries)
+    return pages
+
+def batch_export_pdf(entries, per_file=1, directory="statements", workers=None):
+    # per_file=1 writes one PDF per entry, per_file=k writes k-page volumes, 0 puts everything in one PDF.
+    if per_file < 0:
+        raise ValueError("per_file must be 0 or more")
+    entries = list(entries)
+    if not entries:
+        return [], 0, 0.0
+    os.makedirs(directory, exist_ok=True)
+    start = time.perf_counter()
+    if per_file == 1:
+        jobs = [(unique_filename(f"emi_{entry['date'].replace('-', '')}_{entry.get('id', i)}", "pdf", directory), [entry])
+                for i, entry in enumerate(entries, 1)]
+        chunks = [jobs[i:i + PDF_CHUNK] for i in range(0, len(jobs), PDF_CHUNK)]
+    else:
+        # FPDF 1.7 grows its output buffer by string concatenation, so very large documents get
+        # quadratically slower; volumes keep each file small and let the pool render them in parallel.
+        size = per_file or len(entries)
+        stem = f"emi_statements_{datetime.today().strftime('%Y%m%d')}"
+        jobs = [(unique_filename(stem, "pdf", directory), entries[i:i + size]) for i in range(0, len(entries), size)]
+        chunks = [[job] for job in jobs]
+    if len(chunks) == 1:
+        pages = _render_pdfs(chunks[0])
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            pages = sum(pool.map(_render_pdfs, chunks))
+    return [filename for filename, _ in jobs], pages, time.perf_counter() - start
+
+def grid_entries(grid):
+    today = datetime.today().strftime("%Y-%m-%d")
+    columns = [grid[key].tolist() for key in GRID_COLUMNS]
+    for i, values in enumerate(zip(*columns), 1):
+        yield {"date": today, "id": f"scenario{i}", **dict(zip(GRID_COLUMNS, values))}
+
 
 def new_calculation():
     P = validate_input("Enter principal amount (₹): ")
@@ -73,7 +389,7 @@ def new_calculation():
     if None in (P, R, N):
         return
 
-    emi, interest, total = calculate_emi(P, R, N)
+    emi, interest, total = quote_emi(P, R, N)
     today = datetime.today().strftime("%Y-%m-%d")
     result = {
         "date": today,
@@ -93,31 +409,257 @@ def new_calculation():
     save_to_history(result)
 
     exp = input("Export? (txt/pdf/none): ").strip().lower()
-    if exp == "txt":
-        export_to_txt(result)
-    elif exp == "pdf":
-        export_to_pdf(result)
+    if exp in ("txt", "pdf"):
+        schedule = None
+        if input("Include amortization schedule? (y/n): ").strip().lower() == "y":
+            schedule = amortization_schedule(P, R, N)
+        if exp == "txt":
+            export_to_txt(result, schedule)
+        else:
+            export_to_pdf(result, schedule)
+
+def show_schedule():
+    P = validate_input("Enter principal amount (₹): ")
+    R = validate_input("Enter annual interest rate (%): ")
+    N = validate_input("Enter loan tenure (months): ", int)
+    if None in (P, R, N):
+        return
+    try:
+        prepayments = parse_events(input("Prepayments as month:amount,... (blank for none): ").strip())
+        rate_changes = parse_events(input("Rate changes as month:rate,... (blank for none): ").strip())
+        lookup = input("Look up month (blank to skip): ").strip()
+        lookup = int(lookup) if lookup else None
+    except ValueError:
+        print(" Invalid input.")
+        return
+
+    if lookup:
+        balance, interest = loan_position(P, R, N, lookup, prepayments, rate_changes)
+        print(f" After month {min(lookup, N)}: Balance ₹{balance:,.2f}, Interest paid ₹{interest:,.2f}")
+
+    out = input("Schedule output (screen/txt/pdf/csv/none): ").strip().lower()
+    schedule = amortization_schedule(P, R, N, prepayments, rate_changes)
+    if out == "screen":
+        print(f"{'Month':>5} {'Rate':>6} {'Payment':>12} {'Principal':>12} {'Interest':>12} {'Prepayment':>12} {'Balance':>14}")
+        for row in schedule:
+            print(_schedule_line(row))
+    elif out in ("txt", "pdf"):
+        emi, interest, total = calculate_emi(P, R, N)
+        entry = {
+            "date": datetime.today().strftime("%Y-%m-%d"),
+            "principal": P,
+            "rate": R,
+            "tenure": N,
+            "emi": emi,
+            "interest": interest,
+            "total": total
+        }
+        if prepayments:
+            entry["prepayments"] = prepayments
+        if rate_changes:
+            entry["rate changes"] = rate_changes
+        if out == "txt":
+            export_to_txt(entry, schedule)
+        else:
+            export_to_pdf(entry, schedule)
+    elif out == "csv":
+        filename = unique_filename(f"emi_schedule_{datetime.today().strftime('%Y%m%d')}", "csv")
+        export_schedule_csv(schedule, filename)
+        print(f" Exported to {filename}")
+
+def _prompt_grid():
+    try:
+        import numpy
+    except ImportError:
+        print(" Scenario grid needs NumPy (pip install numpy).")
+        return None
+    try:
+        principals = parse_values(input("Principals (a,b,c or start:stop:step): ").strip())
+        rates = parse_values(input("Annual rates % (a,b,c or start:stop:step): ").strip())
+        tenures = parse_values(input("Tenures in months (a,b,c or start:stop:step): ").strip(), int)
+        budget = input("Max EMI budget (blank for none): ").strip()
+        max_emi = float(budget) if budget else None
+    except ValueError:
+        print(" Invalid input.")
+        return None
+    if not (principals and rates and tenures) or min(principals) <= 0 or min(rates) < 0 or min(tenures) <= 0:
+        print(" Principal and tenure must be > 0 and rate >= 0.")
+        return None
+    sort_by = input("Sort by (emi/interest/total) [emi]: ").strip().lower() or "emi"
+    if sort_by not in ("emi", "interest", "total"):
+        sort_by = "emi"
+    return select_scenarios(emi_grid(principals, rates, tenures), max_emi, sort_by), max_emi
+
+def scenario_grid():
+    prompted = _prompt_grid()
+    if prompted is None:
+        return
+    grid, max_emi = prompted
+    count = len(grid["emi"])
+    print(f"\n {count} scenarios" + (f" with EMI <= ₹{max_emi}" if max_emi is not None else ""))
+    for i in range(min(count, 20)):
+        print(f"  ₹{grid['principal'][i]:,.0f} @ {grid['rate'][i]}% for {grid['tenure'][i]} months -> "
+              f"EMI ₹{grid['emi'][i]:,.2f}, Interest ₹{grid['interest'][i]:,.2f}, Total ₹{grid['total'][i]:,.2f}")
+    if count > 20:
+        print(f"  ... and {count - 20} more")
+    filename = input("Export to CSV file (blank to skip): ").strip()
+    if filename:
+        export_grid_csv(grid, filename)
+        print(f" Exported to {filename}")
+
+def batch_pdf():
+    source = input("Source (history/grid): ").strip().lower()
+    if source == "history":
+        try:
+            start, end = parse_date_range(input("Date or range (YYYY-MM-DD or YYYY-MM-DD:YYYY-MM-DD): "))
+        except ValueError:
+            print(" Invalid date format.")
+            return
+        entries = list(history_between(start, end))
+    elif source == "grid":
+        prompted = _prompt_grid()
+        if prompted is None:
+            return
+        entries = list(grid_entries(prompted[0]))
+    else:
+        print(" Invalid source.")
+        return
+    if not entries:
+        print(" Nothing to export.")
+        return
+    try:
+        per_file = int(input("Pages per PDF (1 = one per entry, 0 = all in one file) [1]: ").strip() or "1")
+        if per_file < 0:
+            raise ValueError
+    except ValueError:
+        print(" Invalid input.")
+        return
+    directory = input("Output folder [statements]: ").strip() or "statements"
+    report_batch(*batch_export_pdf(entries, per_file, directory))
+
+def report_batch(files, pages, elapsed):
+    if not files:
+        print(" Nothing to export.")
+        return
+    print(f" Wrote {pages} pages to {len(files)} PDF file(s) in {elapsed:.2f}s ({pages / max(elapsed, 1e-9):.0f} pages/sec)")
+    if len(files) <= 3:
+        print(f" Exported to {', '.join(files)}")
+
+def pdf_command(args):
+    import argparse
+    parser = argparse.ArgumentParser(prog="loan_emi_calculator.py pdf",
+                                     description="Write PDF statements for a history date range.")
+    parser.add_argument("dates", help="YYYY-MM-DD or YYYY-MM-DD:YYYY-MM-DD")
+    parser.add_argument("per_file", nargs="?", type=int, default=1,
+                        help="pages per PDF: 1 = one per entry, 0 = all in one file (default 1)")
+    parser.add_argument("folder", nargs="?", default="statements")
+    opts = parser.parse_args(args)
+    try:
+        start, end = parse_date_range(opts.dates)
+    except ValueError:
+        parser.error("dates must be YYYY-MM-DD or YYYY-MM-DD:YYYY-MM-DD")
+    if opts.per_file < 0:
+        parser.error("per_file must be 0 or more")
+    report_batch(*batch_export_pdf(history_between(start, end), opts.per_file, opts.folder))
+
+def benchmark_grid():
+    import numpy as np
+    principals = np.arange(100000, 5000001, 50000)
+    rates = np.round(np.arange(6.0, 15.01, 0.25), 2)
+    tenures = np.arange(12, 361, 12)
+    count = len(principals) * len(rates) * len(tenures)
+    start = time.perf_counter()
+    looped = [calculate_emi(float(P), float(R), int(N)) for P in principals for R in rates for N in tenures]
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    grid = emi_grid(principals, rates, tenures)
+    grid_time = time.perf_counter() - start
+    mismatches = sum(row != (e, i, t) for row, e, i, t in zip(looped, grid["emi"].tolist(),
+                                                                grid["interest"].tolist(), grid["total"].tolist()))
+    print(f" {count} scenarios: loop {loop_time * 1000:.1f} ms, grid {grid_time * 1000:.1f} ms "
+          f"({loop_time / grid_time:.0f}x), {mismatches} rows differ from calculate_emi")
+
+def benchmark_schedule():
+    loans = [(100000 + 1000 * i, 6 + (i % 40) * 0.25, 360) for i in range(2000)]
+    prepayments = {60: 50000, 120: 50000}
+    rate_changes = {36: 9.5, 180: 7.25}
+    start = time.perf_counter()
+    walked = []
+    for P, R, N in loans:
+        balance = interest = 0.0
+        for row in amortization_schedule(P, R, N, prepayments, rate_changes):
+            interest += row["interest"]
+            balance = row["balance"]
+            if row["month"] == 300:
+                break
+        walked.append((balance, interest))
+    walk_time = time.perf_counter() - start
+    start = time.perf_counter()
+    looked_up = [loan_position(P, R, N, 300, prepayments, rate_changes) for P, R, N in loans]
+    lookup_time = time.perf_counter() - start
+    worst = max(max(abs(a[0] - b[0]), abs(a[1] - b[1])) for a, b in zip(walked, looked_up))
+    print(f" month-300 position for {len(loans)} loans: schedule walk {walk_time * 1000:.1f} ms, "
+          f"closed form {lookup_time * 1000:.1f} ms ({walk_time / lookup_time:.0f}x), max difference ₹{worst:.6f}")
+
+def benchmark_quotes():
+    import random
+    rng = random.Random(7)
+    # Counter traffic: round-lakh principals, quarter-point rates and yearly tenures, with repeats.
+    quotes = [(rng.choice(range(100000, 5000001, 100000)), rng.choice(STANDARD_RATES[::2]), rng.choice(STANDARD_TENURES[::3]))
+              for _ in range(200000)]
+    direct_time = cached_time = float("inf")
+    for _ in range(3):
+        _quotes.clear()
+        for key in quote_stats:
+            quote_stats[key] = 0
+        start = time.perf_counter()
+        direct = [calculate_emi(P, R, N) for P, R, N in quotes]
+        direct_time = min(direct_time, time.perf_counter() - start)
+        start = time.perf_counter()
+        cached = [quote_emi(P, R, N) for P, R, N in quotes]
+        cached_time = min(cached_time, time.perf_counter() - start)
+    info = quote_cache_info()
+    mismatches = sum(a != b for a, b in zip(direct, cached))
+    print(f" {len(quotes)} quotes: calculate_emi {direct_time * 1000:.1f} ms, quote_emi {cached_time * 1000:.1f} ms "
+          f"({direct_time / cached_time:.1f}x), hit rate {info['hit_rate']:.1%}, "
+          f"factor hits {info['factor_hits']}/{info['misses']}, {mismatches} mismatches")
 
 # ---------- CLI ----------
 def menu():
     print("\n📊 LOAN EMI CALCULATOR")
     print("1. New Calculation")
     print("2. View History by Date")
-    print("3. Exit")
+    print("3. Scenario Grid")
+    print("4. Amortization Schedule")
+    print("5. Batch PDF Export")
+    print("6. Exit")
 
 def main():
     while True:
         menu()
-        choice = input("Choose (1-3): ").strip()
+        choice = input("Choose (1-6): ").strip()
         if choice == "1":
             new_calculation()
         elif choice == "2":
             retrieve_by_date()
         elif choice == "3":
+            scenario_grid()
+        elif choice == "4":
+            show_schedule()
+        elif choice == "5":
+            batch_pdf()
+        elif choice == "6":
             print(" Goodbye! Manage loans wisely.")
             break
         else:
             print(" Invalid option.")
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["bench"]:
+        benchmark_grid()
+        benchmark_schedule()
+        benchmark_quotes()
+    elif sys.argv[1:2] == ["pdf"]:
+        pdf_command(sys.argv[2:])
+    else:
+        main()
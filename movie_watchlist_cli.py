@@ -1,14 +1,267 @@
+import csv
+import gzip
 import json
 import os
+import sys
+import time
+from bisect import bisect_left, insort
+from itertools import islice
 
 WATCHLIST_FILE = "watchlist.json"
+PAGE_SIZE = 20
+SORT_KEYS = ["added", "title", "year", "rating"]
+EXPORT_CHUNK = 1000
+EXPORT_FIELDS = ["id", "title", "genre", "year", "status", "rating", "review"]
+EXPORT_FORMATS = ["json", "jsonl", "csv", "txt"]
+STATS_DIMENSIONS = ["all", "genre", "year", "decade", "status"]
+
+
+def normalize_title(title):
+    return " ".join(title.lower().split())
+
+def _group_keys(movie):
+    try:
+        year = int(movie["year"])
+        decade = f"{year // 10 * 10}s"
+    except ValueError:
+        year = decade = movie["year"]
+    return [("all", "all"), ("genre", movie["genre"].strip().lower()), ("year", year),
+            ("decade", decade), ("status", movie["status"])]
+
+def _sort_key(movie, key):
+    if key == "title":
+        return normalize_title(movie["title"])
+    if key == "year":
+        try:
+            return int(movie["year"])
+        except ValueError:
+            return 0
+    # Highest rated first, unrated last.
+    return -movie["rating"] if movie.get("rating") is not None else 1
+
+
+class Watchlist:
+    # Parsed watchlist kept in memory; re-read only when the file changes on disk.
+    def __init__(self, path=WATCHLIST_FILE):
+        self.path = path
+        self.movies = {}
+        self.title_index = {}
+        self.next_id = 1
+        self.dirty = False
+        self.stats = {dimension: {} for dimension in STATS_DIMENSIONS}
+        self._orders = {}
+        self._stamp = None
+
+    def _disk_stamp(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def load(self):
+        stamp = self._disk_stamp()
+        if self.dirty or stamp == self._stamp:
+            return self
+        data = []
+        if stamp is not None:
+            with open(self.path) as f:
+                data = json.load(f)
+        # next_id is kept on disk so the id of a removed movie is never handed out again.
+        # A plain list is a watchlist saved before it was.
+        high = 1
+        if isinstance(data, dict):
+            high, data = data["next_id"], data["movies"]
+        self.movies.clear()
+        self.title_index.clear()
+        for groups in self.stats.values():
+            groups.clear()
+        self._orders.clear()
+        self.next_id = max(high, max((m.get("id", 0) for m in data), default=0) + 1)
+        # Older watchlists have no IDs; number them once in file order.
+        for movie in data:
+            if "id" not in movie:
+                movie["id"] = self.next_id
+                self.next_id += 1
+            self.movies[movie["id"]] = movie
+            self._index_title(movie)
+            self._tally(movie, 1)
+        self._stamp = stamp
+        return self
+
+    def save(self):
+        if not self.dirty:
+            return
+        # One movie per line: still a JSON document, but json.dump(indent=4) falls back to the
+        # pure-Python encoder and dominated save time on large watchlists.
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(f'{{"next_id": {self.next_id}, "movies": [\n'
+                    + ",\n".join(json.dumps(m) for m in self.movies.values()) + "\n]}\n")
+        os.replace(tmp, self.path)
+        self._stamp = self._disk_stamp()
+        self.dirty = False
+
+    def _index_title(self, movie):
+        self.title_index.setdefault(normalize_title(movie["title"]), []).append(movie["id"])
+
+    def _unindex_title(self, movie):
+        key = normalize_title(movie["title"])
+        ids = self.title_index[key]
+        ids.remove(movie["id"])
+        if not ids:
+            del self.title_index[key]
+
+    def _tally(self, movie, sign):
+        # Add (sign=1) or remove (sign=-1) one movie from every group it belongs to.
+        rating = movie.get("rating")
+        for dimension, key in _group_keys(movie):
+            group = self.stats[dimension].setdefault(key, {"count": 0, "watched": 0, "pending": 0, "rated": 0,
+                                                           "rating_sum": 0.0, "histogram": [0] * 6})
+            group["count"] += sign
+            group[movie["status"]] = group.get(movie["status"], 0) + sign
+            if rating is not None:
+                group["rated"] += sign
+                group["rating_sum"] += sign * rating
+                group["histogram"][min(int(rating), 5)] += sign
+            if group["count"] == 0:
+                del self.stats[dimension][key]
+
+    def group_stats(self, dimension):
+        # Cost is the number of groups in the dimension, not the number of movies.
+        rows = []
+        for key, group in sorted(self.stats[dimension].items(), key=lambda item: str(item[0])):
+            rows.append({"group": key, "count": group["count"], "watched": group["watched"],
+                         "pending": group["pending"], "rated": group["rated"],
+                         "avg_rating": round(group["rating_sum"] / group["rated"], 2) if group["rated"] else None,
+                         "histogram": list(group["histogram"])})
+        return rows
+
+    def sorted_ids(self, key="added"):
+        # Sort orders are built on first use and then kept current by add/update/remove.
+        if key == "added":
+            return list(self.movies)
+        order = self._orders.get(key)
+        if order is None:
+            order = self._orders[key] = sorted((_sort_key(m, key), m["id"]) for m in self.movies.values())
+        return [movie_id for _, movie_id in order]
+
+    def _order_add(self, movie):
+        for key, order in self._orders.items():
+            insort(order, (_sort_key(movie, key), movie["id"]))
+
+    def _order_remove(self, movie):
+        for key, order in self._orders.items():
+            del order[bisect_left(order, (_sort_key(movie, key), movie["id"]))]
+
+    def __len__(self):
+        return len(self.movies)
+
+    def __iter__(self):
+        return iter(self.movies.values())
+
+    def get(self, movie_id):
+        return self.movies.get(movie_id)
+
+    def find_by_title(self, title):
+        return [self.movies[i] for i in self.title_index.get(normalize_title(title), [])]
+
+    def add(self, **fields):
+        movie = {"id": self.next_id, **fields}
+        self.next_id += 1
+        self.movies[movie["id"]] = movie
+        self._index_title(movie)
+        self._tally(movie, 1)
+        self._order_add(movie)
+        self.dirty = True
+        return movie
+
+    def update(self, movie, **changes):
+        if "title" in changes:
+            self._unindex_title(movie)
+        self._tally(movie, -1)
+        self._order_remove(movie)
+        movie.update(changes)
+        self._tally(movie, 1)
+        self._order_add(movie)
+        if "title" in changes:
+            self._index_title(movie)
+        self.dirty = True
+
+    def remove(self, movie):
+        del self.movies[movie["id"]]
+        self._unindex_title(movie)
+        self._tally(movie, -1)
+        self._order_remove(movie)
+        self.dirty = True
+
+
+watchlist = Watchlist()
 
 def load_watchlist():
-    return json.load(open(WATCHLIST_FILE)) if os.path.exists(WATCHLIST_FILE) else []
+    return list(watchlist.load())
+
+def save_watchlist():
+    watchlist.save()
+
+def get_movie(movie_id):
+    return watchlist.load().get(movie_id)
 
-def save_watchlist(data):
-    with open(WATCHLIST_FILE, "w") as f:
-        json.dump(data, f, indent=4)
+def find_movies_by_title(title):
+    return watchlist.load().find_by_title(title)
+
+def watchlist_stats(dimension="all"):
+    return watchlist.load().group_stats(dimension)
+
+def select_movie(prompt):
+    # Accepts a movie ID, or a title when no movie has that ID.
+    choice = input(prompt).strip()
+    if choice.isdigit() and watchlist.get(int(choice)):
+        return watchlist.get(int(choice))
+    matches = watchlist.find_by_title(choice)
+    if len(matches) > 1:
+        list_movies(matches)
+        choice = input("\nSeveral movies have that title. Enter movie ID: ").strip()
+        return next((m for m in matches if str(m["id"]) == choice), None)
+    return matches[0] if matches else None
+
+def _print_movie(movie):
+    print(f"\n[{movie['id']}] {movie['title']} ({movie['year']}) - {movie['genre']} - {movie['status'].capitalize()}")
+    if movie['status'] == 'watched':
+        print(f"    {movie['rating']} | Review: {movie['review']}")
+
+def _print_page(repo, ids, page, page_size):
+    for movie_id in ids[page * page_size:(page + 1) * page_size]:
+        _print_movie(repo.get(movie_id))
+
+def page_movies(repo, ids, page_size=PAGE_SIZE, empty=" Watchlist is empty."):
+    # ids are already in display order; only the visible page is formatted.
+    if not ids:
+        print(empty)
+        return
+    pages = (len(ids) + page_size - 1) // page_size
+    page = 0
+    while True:
+        _print_page(repo, ids, page, page_size)
+        if pages == 1:
+            return
+        cmd = input(f"\nPage {page + 1}/{pages} of {len(ids)} movies - [n]ext, [p]rev, page number, [q]uit: ").strip().lower()
+        if cmd in ("", "n"):
+            if page + 1 == pages:
+                return
+            page += 1
+        elif cmd == "p":
+            page = max(page - 1, 0)
+        elif cmd.isdigit() and 1 <= int(cmd) <= pages:
+            page = int(cmd) - 1
+        elif cmd == "q":
+            return
+        else:
+            print(" Invalid choice.")
+
+def _prompt_sort():
+    key = input(f"Sort by ({'/'.join(SORT_KEYS)}) [added]: ").strip().lower() or "added"
+    return key if key in SORT_KEYS else "added"
 
 def add_movie():
     title = input("Title: ").strip()
@@ -23,127 +276,366 @@ def add_movie():
     except:
         print(" Year must be a number.")
         return
-    data = load_watchlist()
-    data.append({
-        "title": title,
-        "genre": genre,
-        "year": year,
-        "status": status,
-        "rating": None,
-        "review": None
-    })
-    save_watchlist(data)
+    watchlist.load().add(title=title, genre=genre, year=year, status=status, rating=None, review=None)
+    watchlist.save()
     print(" Movie added.")
 
-def list_movies(data=None):
-    data = data or load_watchlist()
-    if not data:
-        print(" Watchlist is empty.")
-        return
-    for i, movie in enumerate(data, 1):
-        print(f"\n[{i}] {movie['title']} ({movie['year']}) - {movie['genre']} - {movie['status'].capitalize()}")
-        if movie['status'] == 'watched':
-            print(f"    {movie['rating']} | Review: {movie['review']}")
+def list_movies(data=None, sort="added"):
+    ids = watchlist.load().sorted_ids(sort) if data is None else [m["id"] for m in data]
+    page_movies(watchlist, ids)
+
+def view_movies():
+    sort = _prompt_sort()
+    size = input(f"Page size [{PAGE_SIZE}]: ").strip()
+    page_size = int(size) if size.isdigit() and int(size) > 0 else PAGE_SIZE
+    page_movies(watchlist, watchlist.load().sorted_ids(sort), page_size)
 
 def edit_movie():
-    data = load_watchlist()
-    list_movies(data)
-    try:
-        idx = int(input("\nEnter movie number to edit: ")) - 1
-        if idx not in range(len(data)):
-            raise IndexError
-        m = data[idx]
-        title = input(f"New title [{m['title']}]: ").strip()
-        genre = input(f"New genre [{m['genre']}]: ").strip()
-        year = input(f"New year [{m['year']}]: ").strip()
-        status = input(f"New status (watched/pending) [{m['status']}]: ").strip().lower()
-
-        if title: data[idx]['title'] = title
-        if genre: data[idx]['genre'] = genre
-        if year.isdigit(): data[idx]['year'] = year
-        if status in ['watched', 'pending']: data[idx]['status'] = status
-
-        save_watchlist(data)
-        print(" Movie updated.")
-    except (ValueError, IndexError):
+    list_movies()
+    m = select_movie("\nEnter movie ID or title to edit: ")
+    if m is None:
         print(" Invalid selection.")
+        return
+    title = input(f"New title [{m['title']}]: ").strip()
+    genre = input(f"New genre [{m['genre']}]: ").strip()
+    year = input(f"New year [{m['year']}]: ").strip()
+    status = input(f"New status (watched/pending) [{m['status']}]: ").strip().lower()
+
+    changes = {}
+    if title: changes['title'] = title
+    if genre: changes['genre'] = genre
+    if year.isdigit(): changes['year'] = year
+    if status in ['watched', 'pending']: changes['status'] = status
+
+    if changes:
+        watchlist.update(m, **changes)
+        watchlist.save()
+    print(" Movie updated.")
 
 def delete_movie():
-    data = load_watchlist()
-    list_movies(data)
-    try:
-        idx = int(input("\nEnter movie number to delete: ")) - 1
-        if idx not in range(len(data)):
-            raise IndexError
-        confirm = input(f"Delete '{data[idx]['title']}'? (y/n): ").strip().lower()
-        if confirm == 'y':
-            data.pop(idx)
-            save_watchlist(data)
-            print(" Movie deleted.")
-    except (ValueError, IndexError):
+    list_movies()
+    m = select_movie("\nEnter movie ID or title to delete: ")
+    if m is None:
         print(" Invalid selection.")
+        return
+    confirm = input(f"Delete '{m['title']}'? (y/n): ").strip().lower()
+    if confirm == 'y':
+        watchlist.remove(m)
+        watchlist.save()
+        print(" Movie deleted.")
 
 def search_or_filter():
-    data = load_watchlist()
+    data = watchlist.load()
     choice = input("Search by (title/genre/status): ").strip().lower()
     keyword = input("Enter keyword: ").strip().lower()
-    result = []
+    sort = _prompt_sort()
+    result = set()
     for m in data:
         if choice == "title" and keyword in m["title"].lower():
-            result.append(m)
+            result.add(m["id"])
         elif choice == "genre" and keyword in m["genre"].lower():
-            result.append(m)
+            result.add(m["id"])
         elif choice == "status" and m["status"].lower() == keyword:
-            result.append(m)
-    list_movies(result)
+            result.add(m["id"])
+    page_movies(data, [i for i in data.sorted_ids(sort) if i in result], empty=" No matching movies.")
 
 def rate_review():
-    data = load_watchlist()
-    watched = [m for m in data if m["status"] == "watched"]
+    watched = [m for m in watchlist.load() if m["status"] == "watched"]
     if not watched:
         print(" No watched movies to rate.")
         return
-    list_movies(watched)
+    page_movies(watchlist, [m["id"] for m in watched])
+    movie = select_movie("\nEnter movie ID or title to review: ")
+    if movie is None or movie["status"] != "watched":
+        print(" Invalid input.")
+        return
     try:
-        idx = int(input("\nEnter movie number to review: ")) - 1
-        if idx not in range(len(watched)):
-            raise IndexError
-        movie = watched[idx]
         rating = float(input("Rating (0–5): ").strip())
         if not (0 <= rating <= 5):
             print(" Rating must be between 0 and 5.")
             return
         review = input("Write your review: ").strip()
-        for m in data:
-            if m["title"] == movie["title"]:
-                m["rating"] = rating
-                m["review"] = review
-                break
-        save_watchlist(data)
+        watchlist.update(movie, rating=rating, review=review)
+        watchlist.save()
         print(" Review saved.")
-    except (ValueError, IndexError):
+    except ValueError:
         print(" Invalid input.")
 
+def show_stats():
+    dimension = input(f"Group by ({'/'.join(STATS_DIMENSIONS)}) [genre]: ").strip().lower() or "genre"
+    if dimension not in STATS_DIMENSIONS:
+        print(" Invalid choice.")
+        return
+    rows = watchlist_stats(dimension)
+    if not rows:
+        print(" Watchlist is empty.")
+        return
+    print(f"\n{dimension.capitalize():<15} {'Movies':>7} {'Watched':>8} {'Pending':>8} {'Avg':>5}  Ratings 0-5")
+    for row in rows:
+        avg = f"{row['avg_rating']:.2f}" if row["avg_rating"] is not None else "-"
+        print(f"{str(row['group'])[:15]:<15} {row['count']:>7} {row['watched']:>8} {row['pending']:>8} {avg:>5}  "
+              + " ".join(str(n) for n in row["histogram"]))
+
+def stream_movies(path=WATCHLIST_FILE):
+    # Watchlists are saved one movie per line, so they can be read without parsing the whole file.
+    # Older pretty-printed files are detected on the first record and parsed in one go instead.
+    if not os.path.exists(path):
+        return
+    with open(path) as f:
+        first = True
+        for line in f:
+            line = line.strip().rstrip(",")
+            if line in ("", "[", "]", "]}") or line.startswith('{"next_id"'):
+                continue
+            try:
+                movie = json.loads(line)
+                if not isinstance(movie, dict):
+                    raise ValueError
+            except ValueError:
+                if not first:
+                    raise
+                f.seek(0)
+                data = json.load(f)
+                yield from data["movies"] if isinstance(data, dict) else data
+                return
+            first = False
+            yield movie
+
+def filter_movies(movies, status=None, genre=None, year_from=None, year_to=None):
+    for m in movies:
+        if status and m["status"].lower() != status:
+            continue
+        if genre and m["genre"].lower() != genre:
+            continue
+        if year_from is not None or year_to is not None:
+            try:
+                year = int(m["year"])
+            except ValueError:
+                continue
+            if (year_from is not None and year < year_from) or (year_to is not None and year > year_to):
+                continue
+        yield m
+
+def _txt_record(m, fields):
+    if fields:
+        return " - ".join(str(m.get(key)) for key in fields) + "\n"
+    text = f"{m['title']} ({m['year']}) - {m['genre']} - {m['status']}\n"
+    if m["status"] == "watched":
+        text += f" {m['rating']} | Review: {m['review']}\n"
+    return text + "\n"
+
+def export_movies(movies, path, fmt, fields=None, compress=False):
+    # Records are pulled lazily and written EXPORT_CHUNK at a time; memory stays bounded by the chunk.
+    columns = fields or EXPORT_FIELDS
+    opener = gzip.open if compress else open
+    count = 0
+    with opener(path, "wt", newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            writer = csv.writer(f)
+            writer.writerow(columns)
+        elif fmt == "json":
+            f.write("[")
+        movies = iter(movies)
+        while True:
+            chunk = list(islice(movies, EXPORT_CHUNK))
+            if not chunk:
+                break
+            if fmt == "csv":
+                writer.writerows([m.get(key) for key in columns] for m in chunk)
+            elif fmt == "txt":
+                f.write("".join(_txt_record(m, fields) for m in chunk))
+            else:
+                lines = (json.dumps({key: m.get(key) for key in columns}) for m in chunk)
+                if fmt == "jsonl":
+                    f.write("".join(line + "\n" for line in lines))
+                else:
+                    f.write(("," if count else "") + "\n" + ",\n".join(lines))
+            count += len(chunk)
+        if fmt == "json":
+            f.write("\n]\n")
+    return count
+
+def run_export(movies, path, fmt, fields=None, compress=False):
+    start = time.perf_counter()
+    count = export_movies(movies, path, fmt, fields, compress)
+    elapsed = time.perf_counter() - start
+    print(f" Exported {count} movies to {path} in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} records/sec)")
+    return count
+
 def export_watchlist():
-    data = load_watchlist()
-    if not data:
+    if not len(watchlist.load()):
         print(" Nothing to export.")
         return
-    fmt = input("Export format (json/txt): ").strip().lower()
-    if fmt == "json":
-        with open("watchlist_export.json", "w") as f:
-            json.dump(data, f, indent=4)
-        print(" Exported to watchlist_export.json")
-    elif fmt == "txt":
-        with open("watchlist_export.txt", "w") as f:
-            for m in data:
-                f.write(f"{m['title']} ({m['year']}) - {m['genre']} - {m['status']}\n")
-                if m["status"] == "watched":
-                    f.write(f" {m['rating']} | Review: {m['review']}\n")
-                f.write("\n")
-        print(" Exported to watchlist_export.txt")
-    else:
+    fmt = input("Export format (json/jsonl/csv/txt): ").strip().lower()
+    if fmt not in EXPORT_FORMATS:
         print(" Invalid format.")
+        return
+    fields = [key.strip() for key in input(f"Fields ({','.join(EXPORT_FIELDS)}) [all]: ").split(",") if key.strip()]
+    if any(key not in EXPORT_FIELDS for key in fields):
+        print(" Invalid field.")
+        return
+    status = input("Only status (watched/pending) [any]: ").strip().lower() or None
+    genre = input("Only genre [any]: ").strip().lower() or None
+    years = input("Year range (e.g. 1990-1999) [any]: ").strip()
+    try:
+        year_from, year_to = parse_year_range(years)
+    except ValueError:
+        print(" Invalid year range.")
+        return
+    compress = input("Gzip output? (y/n): ").strip().lower() == "y"
+    default = f"watchlist_export.{fmt}" + (".gz" if compress else "")
+    path = input(f"Output file [{default}]: ").strip() or default
+    run_export(filter_movies(watchlist, status, genre, year_from, year_to), path, fmt, fields or None, compress)
+
+def parse_year_range(text):
+    if not text:
+        return None, None
+    start, _, end = text.partition("-")
+    return int(start), int(end or start)
+
+def export_command(args):
+    import argparse
+    parser = argparse.ArgumentParser(prog="movie_watchlist_cli.py export",
+                                     description="Stream the watchlist file to JSONL/CSV/txt/JSON.")
+    parser.add_argument("format", choices=EXPORT_FORMATS)
+    parser.add_argument("output")
+    parser.add_argument("--fields", help="comma-separated fields to keep")
+    parser.add_argument("--status", choices=["watched", "pending"])
+    parser.add_argument("--genre")
+    parser.add_argument("--years", help="year or range, e.g. 1990-1999")
+    parser.add_argument("--gzip", action="store_true")
+    opts = parser.parse_args(args)
+    fields = opts.fields.split(",") if opts.fields else None
+    if fields and any(key not in EXPORT_FIELDS for key in fields):
+        parser.error(f"fields must be among {','.join(EXPORT_FIELDS)}")
+    try:
+        year_from, year_to = parse_year_range(opts.years or "")
+    except ValueError:
+        parser.error("invalid --years")
+    movies = filter_movies(stream_movies(), opts.status, opts.genre and opts.genre.lower(), year_from, year_to)
+    run_export(movies, opts.output, opts.format, fields, opts.gzip)
+
+def _best_ms(action, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def _synthetic_watchlist(path, count):
+    genres = ["drama", "comedy", "scifi", "horror", "crime"]
+    with open(path, "w") as f:
+        json.dump([{"id": i, "title": f"Movie {i}", "genre": genres[i % 5], "year": str(1950 + i % 75),
+                    "status": "watched" if i % 2 else "pending", "rating": None, "review": None}
+                   for i in range(1, count + 1)], f, indent=4)
+
+def benchmark_actions(count=100000):
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "watchlist.json")
+    _synthetic_watchlist(path, count)
+    target = f"Movie {count // 2 + 1}"
+
+    def parse():
+        with open(path) as f:
+            return json.load(f)
+
+    def old_lookup():
+        return next(m for m in parse() if m["title"] == target)
+
+    def old_rate():
+        data = parse()
+        next(m for m in data if m["title"] == target)["rating"] = 4.0
+        with open(path, "w") as f:
+            json.dump(data, f, indent=4)
+
+    repo = Watchlist(path)
+    repo.load()
+
+    def new_rate():
+        movie = repo.load().find_by_title(target)[0]
+        repo.update(movie, rating=4.0)
+        repo.save()
+
+    print(f" {count} movies, best of 5 (ms):")
+    print(f"  load for an action   re-parse {_best_ms(parse):9.1f}   cached {_best_ms(repo.load):9.3f}")
+    print(f"  find by title        re-parse {_best_ms(old_lookup):9.1f}   cached {_best_ms(lambda: repo.load().find_by_title(target)):9.3f}")
+    print(f"  rate/review + save   re-parse {_best_ms(old_rate):9.1f}   cached {_best_ms(new_rate):9.1f}")
+
+def benchmark_export(count=100000):
+    import tempfile
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "watchlist.json")
+    _synthetic_watchlist(path, count)
+    repo = Watchlist(path)
+    repo.load()
+    repo.dirty = True
+    repo.save()
+    print(f" streaming export of {count} movies from disk:")
+    for fmt, compress in [("jsonl", False), ("csv", False), ("txt", False), ("jsonl", True)]:
+        out = os.path.join(directory, f"out.{fmt}" + (".gz" if compress else ""))
+        run_export(stream_movies(path), out, fmt, compress=compress)
+    run_export(filter_movies(stream_movies(path), "watched", None, 1990, 1999), os.path.join(directory, "out.csv"),
+               "csv", ["title", "year"])
+
+def benchmark_stats(count=100000):
+    import random
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "watchlist.json")
+    _synthetic_watchlist(path, count)
+    repo = Watchlist(path)
+    repo.load()
+    rng = random.Random(3)
+    for movie_id in rng.sample(range(1, count + 1), 2000):
+        repo.update(repo.get(movie_id), status="watched", rating=rng.choice([1, 2.5, 3, 4, 5]))
+    for movie_id in rng.sample(range(1, count + 1), 500):
+        if repo.get(movie_id):
+            repo.remove(repo.get(movie_id))
+
+    def scan():
+        groups = {}
+        for m in repo:
+            group = groups.setdefault(m["genre"].lower(), [0, 0.0])
+            if m["rating"] is not None:
+                group[0] += 1
+                group[1] += m["rating"]
+        return {key: round(total / rated, 2) if rated else None for key, (rated, total) in groups.items()}
+
+    incremental = {row["group"]: row["avg_rating"] for row in repo.group_stats("genre")}
+    print(f" average rating by genre over {len(repo)} movies: full scan {_best_ms(scan):.1f} ms, "
+          f"incremental {_best_ms(lambda: repo.group_stats('genre')):.3f} ms, "
+          f"{'matches' if incremental == scan() else 'DIFFERS FROM'} a full scan")
+
+def benchmark_paging(count=100000):
+    import io
+    import tempfile
+    from contextlib import redirect_stdout
+    path = os.path.join(tempfile.mkdtemp(), "watchlist.json")
+    _synthetic_watchlist(path, count)
+    repo = Watchlist(path)
+    repo.load()
+    ids = repo.sorted_ids()
+
+    def print_all():
+        with redirect_stdout(io.StringIO()):
+            for movie in repo:
+                _print_movie(movie)
+
+    def print_page():
+        with redirect_stdout(io.StringIO()):
+            _print_page(repo, ids, count // PAGE_SIZE // 2, PAGE_SIZE)
+
+    start = time.perf_counter()
+    repo.sorted_ids("title")
+    build = (time.perf_counter() - start) * 1000
+    movie = repo.get(count // 2)
+    repo.update(movie, title="Aardvark", rating=5.0)
+    start = time.perf_counter()
+    ordered = repo.sorted_ids("title")
+    reuse = (time.perf_counter() - start) * 1000
+    correct = ordered[0] == movie["id"] and ordered == [m["id"] for m in sorted(repo, key=lambda m: (normalize_title(m["title"]), m["id"]))]
+    print(f" listing {count} movies: print all {_best_ms(print_all):.1f} ms, one page {_best_ms(print_page):.3f} ms")
+    print(f" title order: first build {build:.1f} ms, after an edit {reuse:.1f} ms ({'correct' if correct else 'WRONG'})")
 
 def menu():
     print("\n MOVIE WATCHLIST CLI")
@@ -154,12 +646,13 @@ def menu():
     print("5. Rate/Review")
     print("6. View All")
     print("7. Export")
-    print("8. Exit")
+    print("8. Statistics")
+    print("9. Exit")
 
 def main():
     while True:
         menu()
-        choice = input("Choose (1–8): ").strip()
+        choice = input("Choose (1–9): ").strip()
         if choice == "1":
             add_movie()
         elif choice == "2":
@@ -171,14 +664,24 @@ def main():
         elif choice == "5":
             rate_review()
         elif choice == "6":
-            list_movies()
+            view_movies()
         elif choice == "7":
             export_watchlist()
         elif choice == "8":
+            show_stats()
+        elif choice == "9":
             print(" Happy watching!")
             break
         else:
             print(" Invalid option.")
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["bench"]:
+        benchmark_actions()
+        benchmark_export()
+        benchmark_stats()
+        benchmark_paging()
+    elif sys.argv[1:2] == ["export"]:
+        export_command(sys.argv[2:])
+    else:
+        main()
@@ -0,0 +1,89 @@
+import sqlite3
+
+import pytest
+
+import employee_adandence_tracker as tracker
+
+ROLLUPS = ["employee_monthly", "department_daily", "department_monthly"]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    tracker.migrate(connection)
+    connection.executemany("INSERT INTO employees VALUES (?, ?, ?)", [
+        ("E1", "Asha", "Sales"), ("E2", "Ravi", "Sales"), ("E3", "Mei", "Support")])
+    connection.commit()
+    yield connection
+    connection.close()
+
+
+def rollups(connection):
+    # Rows the triggers have emptied stay behind with zero days; readers skip them.
+    return {table: [(key, period, round(hours, 6), days) for key, period, hours, days in
+                    connection.execute(f"SELECT * FROM {table} WHERE days != 0 ORDER BY 1, 2")]
+            for table in ROLLUPS}
+
+
+def assert_matches_rebuild(connection):
+    kept = rollups(connection)
+    tracker.rebuild_rollups(connection)
+    rebuilt = rollups(connection)
+    for table in ROLLUPS:
+        assert kept[table] == rebuilt[table], table
+
+
+def test_insert(connection):
+    connection.executemany("INSERT INTO attendance VALUES (?, ?, ?, ?, ?)", [
+        ("E1", "2024-01-30", "09:00", "17:30", 8.5),
+        ("E2", "2024-01-30", "10:00", "18:15", 8.25),
+        ("E3", "2024-01-31", "09:00", "13:00", 4.0),
+        ("E1", "2024-02-01", "09:00", None, None),
+    ])
+    assert connection.execute("SELECT days, hours FROM department_daily WHERE department='Sales' "
+                              "AND date='2024-01-30'").fetchone() == (2, 16.75)
+    assert_matches_rebuild(connection)
+
+
+def test_update(connection):
+    connection.executemany("INSERT INTO attendance(emp_id, date, check_in) VALUES (?, ?, ?)", [
+        ("E1", "2024-01-31", "09:00"), ("E2", "2024-01-31", "09:30"), ("E3", "2024-02-01", "08:00")])
+    assert_matches_rebuild(connection)
+    connection.execute("UPDATE attendance SET check_out='17:00', working_hours=8.0 WHERE emp_id='E1'")
+    connection.execute("UPDATE attendance SET check_out='17:30', working_hours=8.0 WHERE emp_id='E2'")
+    connection.execute("UPDATE attendance SET check_out='12:00', working_hours=4.0 WHERE emp_id='E3'")
+    assert_matches_rebuild(connection)
+    # Corrections: hours, a date moved into another month, a row moved to another department.
+    connection.execute("UPDATE attendance SET working_hours=7.5 WHERE emp_id='E2'")
+    connection.execute("UPDATE attendance SET date='2024-02-01' WHERE emp_id='E1'")
+    connection.execute("UPDATE attendance SET emp_id='E3', date='2024-02-02' WHERE emp_id='E2'")
+    connection.execute("UPDATE attendance SET check_out=NULL, working_hours=NULL WHERE date='2024-02-01' "
+                       "AND emp_id='E3'")
+    assert_matches_rebuild(connection)
+
+
+def test_delete(connection):
+    connection.executemany("INSERT INTO attendance VALUES (?, ?, ?, ?, ?)", [
+        ("E1", "2024-03-01", "09:00", "17:00", 8.0),
+        ("E2", "2024-03-01", "09:00", "17:00", 8.0),
+        ("E3", "2024-03-02", "09:00", "17:00", 8.0),
+        ("E3", "2024-03-03", "09:00", None, None),
+    ])
+    connection.execute("DELETE FROM attendance WHERE emp_id='E1'")
+    connection.execute("DELETE FROM attendance WHERE emp_id='E3'")
+    assert_matches_rebuild(connection)
+    connection.execute("DELETE FROM attendance")
+    assert rollups(connection) == {table: [] for table in ROLLUPS}
+
+
+def test_migration_builds_rollups_from_existing_rows():
+    connection = sqlite3.connect(":memory:")
+    tracker.migrate(connection, 2)
+    connection.execute("INSERT INTO employees VALUES ('E1', 'Asha', 'Sales')")
+    connection.executemany("INSERT INTO attendance VALUES (?, ?, ?, ?, ?)", [
+        ("E1", "2024-04-01", "09:00", "17:00", 8.0), ("E1", "2024-04-02", "09:00", "13:30", 4.5)])
+    connection.commit()
+    tracker.migrate(connection)
+    assert connection.execute("SELECT days, hours FROM employee_monthly").fetchall() == [(2, 12.5)]
+    assert_matches_rebuild(connection)
+    connection.close()
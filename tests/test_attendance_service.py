@@ -0,0 +1,41 @@
+import asyncio
+import json
+
+import pytest
+
+import employee_adandence_tracker as tracker
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = tracker.AttendanceService(str(tmp_path / "attendance.db"), readers=1)
+    yield service
+    service.close()
+
+
+def call(service, method, target, body=None):
+    return asyncio.run(service.dispatch(method, target, json.dumps(body).encode() if body else b""))
+
+
+def test_check_in_rejects_bad_dates(service):
+    call(service, "POST", "/employees", {"emp_id": "E1", "name": "Asha", "department": "Sales"})
+    for date in ("not-a-date", "2024-1-05", "2024-02-30"):
+        status, body = call(service, "POST", "/check-in", {"emp_id": "E1", "date": date, "time": "09:00"})
+        assert status == 400, date
+        status, body = call(service, "POST", "/check-out", {"emp_id": "E1", "date": date, "time": "17:00"})
+        assert status == 400, date
+    assert call(service, "POST", "/check-in", {"emp_id": "E1", "date": "2024-01-05", "time": "09:00"})[0] == 200
+    assert call(service, "POST", "/check-out", {"emp_id": "E1", "date": "2024-01-05", "time": "17:00"})[0] == 200
+    status, body = call(service, "GET", "/reports/monthly?emp_id=E1&month=2024-01")
+    assert (status, body["total_hours"]) == (200, 8.0)
+
+
+def test_monthly_report_rejects_bad_month(service):
+    for month in ("2024-13", "2024-013", "January"):
+        assert call(service, "GET", f"/reports/monthly?emp_id=E1&month={month}") == (
+            400, {"error": "Invalid month, expected YYYY-MM."})
+
+
+def test_non_string_field(service):
+    status, body = call(service, "POST", "/check-in", {"emp_id": ["E1"], "time": "09:00"})
+    assert status == 400
@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+
+import Book_library_CLI as library
+
+
+def book(title, status="Unread"):
+    return {"title": title, "author": "Author", "genre": "Fiction", "status": status}
+
+
+def reopen(monkeypatch):
+    # Drop everything held in memory, as a fresh process would start.
+    for name, value in (("_books", None), ("_next_slot", 0), ("_title_index", {}), ("_genre_index", {}),
+                        ("_status_index", {}), ("_gram_index", None), ("_seq", 0), ("_journal_len", 0)):
+        monkeypatch.setattr(library, name, value)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(library, "COMPACT_BACKEND", False)
+    reopen(monkeypatch)
+    return tmp_path
+
+
+def journal_seqs():
+    with open(library.JOURNAL_FILE) as f:
+        return [json.loads(line)["seq"] for line in f]
+
+
+def test_journal_replay(store, monkeypatch):
+    library._commit({"op": "add", "book": book("Dune")})
+    library._commit({"op": "add", "book": book("Emma")})
+    library._commit({"op": "update", "title": "dune", "fields": {"status": "Read"}})
+    library._commit({"op": "delete", "title": "Emma"})
+    reopen(monkeypatch)
+    assert library.load_books() == [book("Dune", "Read")]
+    assert library._seq == 4
+
+
+def test_torn_journal_line_is_truncated(store, monkeypatch):
+    library._commit({"op": "add", "book": book("Dune")})
+    library._commit({"op": "add", "book": book("Emma")})
+    good = os.path.getsize(library.JOURNAL_FILE)
+    with open(library.JOURNAL_FILE, "a") as f:
+        f.write('{"op": "add", "book": {"title": "Tor')
+    reopen(monkeypatch)
+    assert [b["title"] for b in library.load_books()] == ["Dune", "Emma"]
+    assert os.path.getsize(library.JOURNAL_FILE) == good
+    library._commit({"op": "add", "book": book("Ulysses")})
+    assert journal_seqs() == [1, 2, 3]
+    reopen(monkeypatch)
+    assert [b["title"] for b in library.load_books()] == ["Dune", "Emma", "Ulysses"]
+
+
+def test_journal_line_without_newline_is_truncated(store, monkeypatch):
+    library._commit({"op": "add", "book": book("Dune")})
+    good = os.path.getsize(library.JOURNAL_FILE)
+    with open(library.JOURNAL_FILE, "a") as f:
+        f.write(json.dumps({"seq": 2, "op": "add", "book": book("Emma")}))
+    reopen(monkeypatch)
+    assert [b["title"] for b in library.load_books()] == ["Dune"]
+    assert os.path.getsize(library.JOURNAL_FILE) == good
+
+
+def test_crash_between_snapshot_and_truncate(store, monkeypatch):
+    library._commit({"op": "add", "book": book("Dune")})
+    library._commit({"op": "add", "book": book("Emma")})
+    library._commit({"op": "delete", "title": "Emma"})
+    with open(library.JOURNAL_FILE) as f:
+        stale = f.read()
+    library.compact_books()
+    # Put the journal back as if the process died before truncating it.
+    with open(library.JOURNAL_FILE, "w") as f:
+        f.write(stale)
+    reopen(monkeypatch)
+    assert library.load_books() == [book("Dune")]
+    assert library._seq == 3
+    library._commit({"op": "add", "book": book("Ulysses")})
+    assert journal_seqs() == [1, 2, 3, 4]
+    reopen(monkeypatch)
+    assert [b["title"] for b in library.load_books()] == ["Dune", "Ulysses"]
+    assert [b["title"] for b in library.find_books_by_title("ulysses")] == ["Ulysses"]
+
+
+def test_snapshot_without_sequence(store, monkeypatch):
+    with open(library.DATA_FILE, "w") as f:
+        json.dump([book("Dune")], f)
+    library._commit({"op": "add", "book": book("Emma")})
+    reopen(monkeypatch)
+    assert [b["title"] for b in library.load_books()] == ["Dune", "Emma"]
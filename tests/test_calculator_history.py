@@ -0,0 +1,77 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_spec = importlib.util.spec_from_file_location(
+    "calculator", os.path.join(ROOT, "Command-line_Calculator_with_History.py"))
+calculator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(calculator)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calculator.load_history()
+    return tmp_path
+
+
+def ids():
+    return [entry["id"] for entry in calculator.history]
+
+
+def log_ids():
+    with open(calculator.HISTORY_LOG) as f:
+        return [json.loads(line)["id"] for line in f]
+
+
+def test_history_replay(store):
+    calculator.add_history_entry("1+1", 2)
+    calculator.add_history_entry("2*3", 6)
+    calculator._append_log({"delete": 1})
+    calculator.load_history()
+    assert [entry["expression"] for entry in calculator.history] == ["2*3"]
+    assert calculator._next_id == 3
+
+
+def test_torn_log_line_is_truncated(store):
+    calculator.add_history_entry("1+1", 2)
+    calculator.add_history_entry("2*3", 6)
+    good = os.path.getsize(calculator.HISTORY_LOG)
+    with open(calculator.HISTORY_LOG, "a") as f:
+        f.write('{"id": 3, "expre')
+    calculator.load_history()
+    assert ids() == [1, 2]
+    assert os.path.getsize(calculator.HISTORY_LOG) == good
+    calculator.add_history_entry("4-1", 3)
+    calculator.add_history_entry("9/3", 3.0)
+    assert log_ids() == [1, 2, 3, 4]
+    calculator.load_history()
+    assert ids() == [1, 2, 3, 4]
+
+
+def test_log_line_without_newline_is_truncated(store):
+    calculator.add_history_entry("1+1", 2)
+    good = os.path.getsize(calculator.HISTORY_LOG)
+    with open(calculator.HISTORY_LOG, "a") as f:
+        f.write(json.dumps({"id": 2, "expression": "2*3", "result": 6}))
+    calculator.load_history()
+    assert ids() == [1]
+    assert os.path.getsize(calculator.HISTORY_LOG) == good
+
+
+def test_crash_between_snapshot_and_truncate(store):
+    calculator.add_history_entry("1+1", 2)
+    calculator.add_history_entry("2*3", 6)
+    with open(calculator.HISTORY_LOG) as f:
+        stale = f.read()
+    calculator.save_history()
+    with open(calculator.HISTORY_LOG, "w") as f:
+        f.write(stale)
+    calculator.load_history()
+    assert ids() == [1, 2]
+    calculator.add_history_entry("4-1", 3)
+    calculator.load_history()
+    assert ids() == [1, 2, 3]
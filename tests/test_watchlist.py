@@ -0,0 +1,31 @@
+import json
+
+import movie_watchlist_cli as movies
+
+
+def add(repo, title):
+    return repo.add(title=title, genre="Drama", year="1999", status="pending", rating=None, review=None)
+
+
+def test_removed_ids_are_not_reused(tmp_path):
+    path = str(tmp_path / "watchlist.json")
+    repo = movies.Watchlist(path).load()
+    for title in ("Heat", "Ran", "Alien"):
+        add(repo, title)
+    repo.remove(repo.get(3))
+    repo.save()
+    repo = movies.Watchlist(path).load()
+    assert add(repo, "Brazil")["id"] == 4
+    repo.save()
+    assert [m["title"] for m in movies.stream_movies(path)] == ["Heat", "Ran", "Brazil"]
+
+
+def test_plain_list_watchlist(tmp_path):
+    path = str(tmp_path / "watchlist.json")
+    with open(path, "w") as f:
+        json.dump([{"title": "Heat", "genre": "Crime", "year": "1995", "status": "watched",
+                    "rating": None, "review": None}], f, indent=4)
+    assert [m["title"] for m in movies.stream_movies(path)] == ["Heat"]
+    repo = movies.Watchlist(path).load()
+    assert [m["id"] for m in repo] == [1]
+    assert add(repo, "Ran")["id"] == 2